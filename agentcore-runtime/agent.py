@@ -7,6 +7,10 @@ https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/getting-started-cu
 - POST /invocations: エージェント呼び出し
 - GET /ping: ヘルスチェック
 
+ストリーミング（SSE）:
+- POST /invocations/stream: エージェント呼び出し
+- POST /sessions/{session_id}/messages/stream: メッセージ送信
+
 追加エンドポイント（ダッシュボード用）:
 - GET /health: ヘルスチェック
 - POST /sessions: セッション作成
@@ -18,18 +22,32 @@ https://docs.aws.amazon.com/bedrock-agentcore/latest/devguide/getting-started-cu
 - GET /agents/tools: 利用可能ツール
 """
 
-import json
+import asyncio
+import gzip
+import hashlib
 import logging
 import os
 import sys
-import uuid
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
+from itertools import islice
+from secrets import token_hex
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+import anyio.to_thread
+import boto3
+import orjson
+from botocore.config import Config
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.concurrency import run_in_threadpool
 from strands import Agent
 from strands.models import BedrockModel
 
@@ -45,57 +63,606 @@ logger = logging.getLogger(__name__)
 # FastAPI Application
 # ===========================================
 
+# Strands Agentの呼び出しはBedrockへのブロッキング呼び出しのためスレッドプールで実行する。
+# 同時に処理できる呼び出し数はこのスレッド数で決まる。
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
+
+
+# レスポンスのtimestamp等、秒未満の精度が不要な箇所ではリクエスト毎に
+# datetimeを生成せず、定期更新されるISO文字列を使う
+TIMESTAMP_REFRESH_INTERVAL = 0.25
+_ts_cache = [datetime.utcnow().isoformat()]
+
+
+def _ping_body(timestamp: str) -> bytes:
+    return b'{"status":"healthy","timestamp":"' + timestamp.encode() + b'"}'
+
+
+# /pingのレスポンスもtimestamp更新時にまとめて構築する
+_ping_cache = [_ping_body(_ts_cache[0])]
+
+
+def _cached_now() -> str:
+    """定期更新されるUTC時刻（ISO形式）を返す"""
+    return _ts_cache[0]
+
+
+async def _refresh_timestamp() -> None:
+    while True:
+        now = datetime.utcnow().isoformat()
+        _ts_cache[0] = now
+        _ping_cache[0] = _ping_body(now)
+        await asyncio.sleep(TIMESTAMP_REFRESH_INTERVAL)
+
+
+async def _warm_up_model() -> None:
+    """BedrockModelを先行作成する（失敗時は初回呼び出しで再作成されるため警告のみ）"""
+    try:
+        await anyio.to_thread.run_sync(get_bedrock_model)
+    except Exception as e:
+        logger.warning(f"Bedrock model warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    logger.info(f"Threadpool size: {THREADPOOL_SIZE}")
+    timestamp_refresher = asyncio.create_task(_refresh_timestamp())
+    # /pingを待たせないよう、BedrockModelの作成はバックグラウンドで先行させる
+    model_warmup = asyncio.create_task(_warm_up_model())
+    yield
+    timestamp_refresher.cancel()
+    model_warmup.cancel()
+
+
+# 本番ではOpenAPIスキーマ生成と/docs, /redocを無効化する
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+ENABLE_DOCS = ENVIRONMENT not in ("prod", "production")
+
 app = FastAPI(
     title="AgentCore Runtime Agent",
     description="Strands Agents on AgentCore Runtime - Dashboard API",
     version="1.0.0",
+    lifespan=lifespan,
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
+    generate_unique_id_function=lambda route: route.name,
 )
 
 # CORS設定
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# StarletteのCORSMiddlewareではなく最小限のASGIミドルウェアで処理する
+# （ヘッダーは事前構築、Requestオブジェクトも生成しない）。
+# ALLOWED_ORIGINSはカンマ区切り。"*"の場合は全オリジンを許可する
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
+_CORS_ALLOW_ALL = "*" in ALLOWED_ORIGINS
+_CORS_ORIGINS = frozenset(o.encode() for o in ALLOWED_ORIGINS)
+
+# オリジンを限定する場合に許可するリクエストヘッダー
+# （ダッシュボードはAgentCoreのセッションIDヘッダーを付与する）
+_CORS_ALLOW_HEADERS = (
+    b"content-type, authorization, x-amzn-bedrock-agentcore-runtime-session-id"
 )
 
+# プリフライトはmax-ageの間ブラウザにキャッシュさせる
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"GET, POST, DELETE, OPTIONS"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+_CORS_RESPONSE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+
+
+class CORSMiddleware:
+    """許可オリジンのみにCORSヘッダーを付与するミドルウェア
+
+    credentials付きリクエストに対応するため、許可されたOriginの値をそのまま
+    Access-Control-Allow-Originとして返す。Originのない、または許可されていない
+    リクエストにはCORSヘッダーを付与しない。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or not (_CORS_ALLOW_ALL or origin in _CORS_ORIGINS):
+            await self.app(scope, receive, send)
+            return
+
+        # プリフライトはアプリに渡さず即応答する。
+        # 全オリジン許可時は allow_headers="*" 相当として要求ヘッダーをそのまま許可する
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            allow_headers = (
+                request_headers
+                if _CORS_ALLOW_ALL and request_headers is not None
+                else _CORS_ALLOW_HEADERS
+            )
+            headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-headers", allow_headers),
+                *_CORS_PREFLIGHT_HEADERS,
+            ]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"access-control-allow-origin", origin),
+                    *_CORS_RESPONSE_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(CORSMiddleware)
+
+
+class ResponseTimeMiddleware:
+    """処理時間をX-Response-Time-msヘッダーで返すミドルウェア
+
+    レスポンスヘッダー送信時点までの時間（ストリーミングでは最初の応答まで）を計測する。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-response-time-ms", f"{elapsed_ms:.1f}".encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+
+app.add_middleware(ResponseTimeMiddleware)
+
 # ===========================================
 # Strands Agent Setup
 # ===========================================
 
 MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-20250514-v1:0")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
+# レイテンシ最適化推論（対応モデル/リージョンのみ。未対応の組み合わせではBedrockがエラーを返す）
+BEDROCK_LATENCY_OPTIMIZED = os.getenv("BEDROCK_LATENCY_OPTIMIZED", "0") == "1"
+# 1回のBedrock呼び出しのタイムアウト（秒）とタイムアウト時の再試行回数
+BEDROCK_TIMEOUT_S = float(os.getenv("BEDROCK_TIMEOUT_S", "60"))
+BEDROCK_MAX_RETRIES = int(os.getenv("BEDROCK_MAX_RETRIES", "2"))
 
-# BedrockModel初期化
-bedrock_model = BedrockModel(
-    model_id=MODEL_ID,
-    region_name=AWS_REGION,
-)
+# BedrockModelはimport時ではなく初回利用時に作成する（コールドスタート短縮）。
+# 接続プールはスレッドプールと同数にし、並列呼び出しがソケット待ちにならないようにする
+_bedrock_model: BedrockModel | None = None
+_bedrock_model_lock = threading.Lock()
+
+
+def get_bedrock_model() -> BedrockModel:
+    """共有BedrockModelを取得（初回呼び出し時に作成）
 
-# Strands Agent初期化
-strands_agent = Agent(
-    model=bedrock_model,
-    system_prompt="""あなたは親切で知識豊富なAIアシスタントです。
+    スレッドプールから同時に呼ばれうるためロックで一度だけ作成する。
+    """
+    global _bedrock_model
+    if _bedrock_model is None:
+        with _bedrock_model_lock:
+            if _bedrock_model is None:
+                _bedrock_model = BedrockModel(
+                    model_id=MODEL_ID,
+                    boto_session=boto3.Session(region_name=AWS_REGION),
+                    boto_client_config=Config(
+                        max_pool_connections=THREADPOOL_SIZE,
+                        read_timeout=BEDROCK_TIMEOUT_S,
+                        # 接続確立の失敗は早めに検知して再試行に回す
+                        connect_timeout=3,
+                        # スロットリング時はクライアント側でレート調整し、再試行の集中を防ぐ。
+                        # タイムアウトの再試行はrun_agent_with_timeout側で行うため最小限にする
+                        retries={"max_attempts": 1, "mode": "adaptive"},
+                        # アイドル中の接続を維持し、TLSハンドシェイクの再実行を避ける
+                        tcp_keepalive=True,
+                    ),
+                    additional_args=(
+                        {"performanceConfig": {"latency": "optimized"}}
+                        if BEDROCK_LATENCY_OPTIMIZED
+                        else None
+                    ),
+                )
+                logger.info(f"Strands Agent initialized with model: {MODEL_ID}")
+    return _bedrock_model
+
+
+SYSTEM_PROMPT = """あなたは親切で知識豊富なAIアシスタントです。
 ユーザーの質問に対して、正確で役立つ回答を提供してください。
-日本語で応答してください。""",
+日本語で応答してください。"""
+
+
+def create_agent() -> Agent:
+    """Strands Agentを作成
+
+    Agentは会話履歴を保持し同時呼び出しをサポートしないため、呼び出し毎に作成する。
+    BedrockModel（boto3クライアント）は共有する。
+    """
+    return Agent(model=get_bedrock_model(), system_prompt=SYSTEM_PROMPT)
+
+
+def run_agent(prompt: str) -> Any:
+    """Strands Agentを同期実行（スレッドプールから呼び出す）"""
+    return create_agent()(prompt)
+
+
+async def run_agent_with_timeout(prompt: str) -> Any:
+    """Strands Agentをタイムアウト付きで実行し、タイムアウト時は再試行する
+
+    応答時間のばらつきが大きいため、詰まった呼び出しを待ち続けずに打ち切る。
+    再試行も全てタイムアウトした場合は504を返す。
+    """
+    for attempt in range(BEDROCK_MAX_RETRIES + 1):
+        try:
+            return await asyncio.wait_for(
+                run_in_threadpool(run_agent, prompt), timeout=BEDROCK_TIMEOUT_S
+            )
+        except TimeoutError:
+            logger.warning(
+                f"Bedrock call timed out after {BEDROCK_TIMEOUT_S}s "
+                f"(attempt {attempt + 1}/{BEDROCK_MAX_RETRIES + 1})"
+            )
+    raise HTTPException(status_code=504, detail="Model invocation timed out")
+
+
+# ===========================================
+# Response Cache
+# ===========================================
+
+# 同一プロンプトへの応答テキストをキャッシュする（LLM応答は非決定的なためオプトイン）
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "0") == "1"
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", "300"))
+
+
+def _prompt_key(prompt: str) -> bytes:
+    """応答を共有できるリクエストのキー（モデルID・システムプロンプト・プロンプトのハッシュ）"""
+    return hashlib.blake2b(
+        f"{MODEL_ID}|{SYSTEM_PROMPT}|{prompt}".encode(), digest_size=16
+    ).digest()
+
+
+class ResponseCache:
+    """TTL付きLRUの応答キャッシュ"""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> str | None:
+        text = self._cache.get(key)
+        if text is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return text
+
+    def set(self, key: bytes, text: str) -> None:
+        self._cache[key] = text
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "enabled": True,
+            "size": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+response_cache = (
+    ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL) if RESPONSE_CACHE_ENABLED else None
 )
 
-logger.info(f"Strands Agent initialized with model: {MODEL_ID}")
+# 実行中のモデル呼び出し（同一プロンプトの同時リクエストはこれを待つ）
+_inflight: dict[bytes, asyncio.Task] = {}
+
+
+async def _generate_text(key: bytes, prompt: str) -> str:
+    text = _extract_text(await run_agent_with_timeout(prompt))
+    if response_cache is not None:
+        response_cache.set(key, text)
+    return text
+
+
+def _finish_inflight(key: bytes, task: asyncio.Task) -> None:
+    _inflight.pop(key, None)
+    # 待機者が全員キャンセルされた場合でも例外を回収済みにする
+    if not task.cancelled():
+        task.exception()
+
+
+async def generate_response(prompt: str) -> str:
+    """プロンプトに対する応答テキストを生成
+
+    キャッシュ有効時はキャッシュを利用する。同一プロンプトの同時リクエストは
+    キャッシュの有無に関わらず1回のモデル呼び出しにまとめる（singleflight）。
+    """
+    key = _prompt_key(prompt)
+    if response_cache is not None:
+        text = response_cache.get(key)
+        if text is not None:
+            return text
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_generate_text(key, prompt))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _finish_inflight(key, t))
+    # 1つのリクエストの切断で他の待機者の呼び出しをキャンセルしない
+    return await asyncio.shield(task)
+
 
 # ===========================================
-# In-Memory Session Storage
+# Session Storage
 # ===========================================
 
-sessions: dict[str, dict] = {}
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))
+MAX_SESSION_MESSAGES = int(os.getenv("MAX_SESSION_MESSAGES", "10000"))
+MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "10000"))
+
+
+class SessionStore(ABC):
+    """セッションストア抽象インターフェース
+
+    get() はメッセージ本体を含まず、message_count を付与したセッション情報を返す。
+    """
+
+    @abstractmethod
+    async def create(self, session: dict[str, Any]) -> None:
+        """セッションを作成"""
+        ...
+
+    @abstractmethod
+    async def get(self, session_id: str) -> dict[str, Any] | None:
+        """セッション情報を取得（存在しない場合はNone）"""
+        ...
+
+    @abstractmethod
+    async def append_message(self, session_id: str, message: dict[str, Any]) -> bool:
+        """メッセージを追加（存在しない場合はFalse）"""
+        ...
+
+    @abstractmethod
+    async def get_messages(
+        self, session_id: str, offset: int, limit: int
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        """メッセージ一覧と総件数を取得（存在しない場合はNone）"""
+        ...
+
+    @abstractmethod
+    async def set_state(self, session_id: str, state: str) -> bool:
+        """状態を更新（存在しない場合はFalse）"""
+        ...
+
+
+class InMemorySessionStore(SessionStore):
+    """インメモリ実装のセッションストア（単一ワーカー用）
+
+    セッションはTTL付きLRUで保持し、期限切れ・上限超過分は破棄する。
+    メッセージは上限付きdequeに保持し、溢れた古いメッセージは破棄する。
+    first_seq に破棄済み件数を保持し、offset と件数は通し番号で扱う。
+    各操作はawaitを含まないため、イベントループ上でロックなしに整合する。
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        ttl: int = SESSION_TTL,
+        max_messages: int = MAX_SESSION_MESSAGES,
+    ):
+        self._sessions: TTLCache = TTLCache(maxsize=max_sessions, ttl=ttl)
+        self._max_messages = max_messages
+
+    async def create(self, session: dict[str, Any]) -> None:
+        self._sessions[session["session_id"]] = {
+            **session,
+            "messages": deque(maxlen=self._max_messages),
+            "first_seq": 0,
+        }
+
+    async def get(self, session_id: str) -> dict[str, Any] | None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        info = {k: v for k, v in session.items() if k not in ("messages", "first_seq")}
+        info["message_count"] = len(session["messages"]) + session["first_seq"]
+        return info
+
+    async def append_message(self, session_id: str, message: dict[str, Any]) -> bool:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return False
+        messages = session["messages"]
+        if len(messages) == messages.maxlen:
+            session["first_seq"] += 1
+        messages.append(message)
+        return True
+
+    async def get_messages(
+        self, session_id: str, offset: int, limit: int
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        messages = session["messages"]
+        first_seq = session["first_seq"]
+        start = max(0, offset - first_seq)
+        page = list(islice(messages, start, start + max(0, limit)))
+        return page, len(messages) + first_seq
+
+    async def set_state(self, session_id: str, state: str) -> bool:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return False
+        session["state"] = state
+        return True
+
+
+class RedisSessionStore(SessionStore):
+    """Redis実装のセッションストア（複数ワーカー/レプリカ間で共有）
+
+    キー構成（Redis Clusterで同一スロットに載るようsession_idをハッシュタグにする）:
+    - sess:{{session_id}}: セッション情報（Hash）
+    - sess:{{session_id}}:msgs: メッセージ（orjsonエンコード済みList）
+
+    InMemorySessionStoreと同様にメッセージはmax_messages件に切り詰め、
+    破棄済み件数をHashのfirst_seqに保持して offset と件数を通し番号で扱う。
+    TTLはメッセージ追加のたびに両キーとも延長する（利用中のセッションは失効しない）。
+    """
+
+    # セッションの存在確認と更新を1往復・アトミックに行う
+    _APPEND_MESSAGE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local n = redis.call('RPUSH', KEYS[2], ARGV[1])
+local overflow = n - tonumber(ARGV[3])
+if overflow > 0 then
+  redis.call('LTRIM', KEYS[2], overflow, -1)
+  redis.call('HINCRBY', KEYS[1], 'first_seq', overflow)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+    _GET_MESSAGES_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return false end
+local first_seq = tonumber(redis.call('HGET', KEYS[1], 'first_seq') or '0')
+local total = redis.call('LLEN', KEYS[2]) + first_seq
+local limit = tonumber(ARGV[2])
+if limit <= 0 then return {total, {}} end
+local start = math.max(0, tonumber(ARGV[1]) - first_seq)
+return {total, redis.call('LRANGE', KEYS[2], start, start + limit - 1)}
+"""
+    _SET_STATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+redis.call('HSET', KEYS[1], 'state', ARGV[1])
+return 1
+"""
+
+    def __init__(self, url: str, ttl: int = 3600, max_messages: int = MAX_SESSION_MESSAGES):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._ttl = ttl
+        self._max_messages = max_messages
+        self._append_message = self._redis.register_script(self._APPEND_MESSAGE_SCRIPT)
+        self._get_messages = self._redis.register_script(self._GET_MESSAGES_SCRIPT)
+        self._set_state = self._redis.register_script(self._SET_STATE_SCRIPT)
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"sess:{{{session_id}}}"
+
+    @staticmethod
+    def _msgs_key(session_id: str) -> str:
+        return f"sess:{{{session_id}}}:msgs"
+
+    async def create(self, session: dict[str, Any]) -> None:
+        key = self._key(session["session_id"])
+        mapping = {k: v for k, v in session.items() if v is not None}
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self._ttl)
+            await pipe.execute()
+
+    async def get(self, session_id: str) -> dict[str, Any] | None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(self._key(session_id))
+            pipe.llen(self._msgs_key(session_id))
+            info, message_count = await pipe.execute()
+        if not info:
+            return None
+        info["message_count"] = message_count + int(info.pop("first_seq", 0))
+        return info
+
+    async def append_message(self, session_id: str, message: dict[str, Any]) -> bool:
+        return bool(await self._append_message(
+            keys=[self._key(session_id), self._msgs_key(session_id)],
+            args=[orjson.dumps(message), self._ttl, self._max_messages],
+        ))
+
+    async def get_messages(
+        self, session_id: str, offset: int, limit: int
+    ) -> tuple[list[dict[str, Any]], int] | None:
+        # InMemorySessionStoreと同じく負のoffset/limitは0として扱う
+        # （LRANGEの負インデックスは末尾からの位置になるため）
+        result = await self._get_messages(
+            keys=[self._key(session_id), self._msgs_key(session_id)],
+            args=[max(0, offset), max(0, limit)],
+        )
+        if result is None:
+            return None
+        total_count, raw_messages = result
+        return [orjson.loads(m) for m in raw_messages], total_count
+
+    async def set_state(self, session_id: str, state: str) -> bool:
+        return bool(await self._set_state(keys=[self._key(session_id)], args=[state]))
+
+
+def create_session_store() -> SessionStore:
+    """REDIS_URLが設定されていればRedis、未設定ならインメモリを使用"""
+    if REDIS_URL:
+        logger.info("Using RedisSessionStore")
+        return RedisSessionStore(REDIS_URL, ttl=SESSION_TTL)
+    return InMemorySessionStore()
+
+
+session_store = create_session_store()
 
 # ===========================================
 # Request/Response Models
 # ===========================================
 
+# リクエストモデルは未知フィールドを明示的に無視し、検証後は変更不可とする
+# （Pydantic v2のBaseModelは__slots__に対応しないため、slotsは指定しない）。
+# レスポンスはdictを返し、response_modelでの検証を境界の1回のみとする
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 # --- Invocation Models (AgentCore必須) ---
 
 class InvocationInput(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     # 基本フィールド（チャット用）
     prompt: str | None = None
     messages: list[dict[str, Any]] | None = None
@@ -113,9 +680,13 @@ class InvocationInput(BaseModel):
     # ベンチマーク関連
     test_cases: list[str] | None = None
     iterations: int | None = None
+    # ストリーミング（チャット時のみ有効、NDJSONで逐次返却）
+    stream: bool = False
 
 
 class InvocationRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     input: InvocationInput
 
 
@@ -140,6 +711,8 @@ class InvocationResponse(BaseModel):
 # --- Session Models (ダッシュボード用) ---
 
 class CreateSessionRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     agent_id: str | None = None
     user_id: str | None = None
 
@@ -151,8 +724,11 @@ class CreateSessionResponse(BaseModel):
 
 
 class SendMessageRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     instruction: str
     tools: list[dict[str, Any]] | None = None
+    stream: bool = False
 
 
 class SendMessageResponse(BaseModel):
@@ -215,6 +791,148 @@ class ToolsResponse(BaseModel):
     total_count: int
 
 
+# ===========================================
+# Static Payloads
+# ===========================================
+# 内容が起動時に確定するレスポンスは一度だけシリアライズし、リクエスト毎の
+# 検証・エンコードを省く。
+
+_AGENT_INFO: dict[str, Any] = {
+    "agent_type": "strands",
+    "model_id": MODEL_ID,
+    "provider": "AWS Bedrock AgentCore",
+    "capabilities": ["conversation", "tool_use", "memory", "streaming"],
+}
+
+_AGENT_COMPARISON: dict[str, Any] = {
+    "strands": {
+        "name": "AWS Strands Agents",
+        "strengths": [
+            "AWS Bedrockネイティブ統合",
+            "AgentCore Memory/Identity連携",
+            "サーバーレス実行",
+            "エンタープライズセキュリティ",
+        ],
+        "features": {
+            "bedrock_native": True,
+            "memory_api": True,
+            "serverless": True,
+            "multi_provider": False,
+            "open_source": True,
+        },
+    },
+    "langchain": {
+        "name": "LangChain + LangGraph",
+        "strengths": [
+            "豊富なエコシステム",
+            "マルチプロバイダー対応",
+            "柔軟なワークフロー",
+            "コミュニティサポート",
+        ],
+        "features": {
+            "bedrock_native": False,
+            "memory_api": False,
+            "serverless": False,
+            "multi_provider": True,
+            "open_source": True,
+        },
+    },
+}
+
+_AGENT_TOOLS: dict[str, Any] = {
+    "agent_type": "strands",
+    "tools": [
+        {"name": "get_current_weather", "description": "現在の天気を取得", "available": True},
+        {"name": "search_documents", "description": "ドキュメント検索", "available": True},
+        {"name": "calculate", "description": "数式計算", "available": True},
+        {"name": "create_task", "description": "タスク作成", "available": True},
+        {"name": "fetch_url", "description": "URL取得", "available": True},
+    ],
+    "total_count": 5,
+}
+
+_AGENT_INFO_BYTES = orjson.dumps(_AGENT_INFO)
+_AGENT_COMPARISON_BYTES = orjson.dumps(_AGENT_COMPARISON)
+_AGENT_TOOLS_BYTES = orjson.dumps(_AGENT_TOOLS)
+_AGENT_COMPARISON_GZ = gzip.compress(_AGENT_COMPARISON_BYTES, 6)
+
+_HEALTH: dict[str, Any] = {
+    "status": "healthy",
+    "version": "1.0.0",
+    "agent_type": "strands",
+    "model_id": MODEL_ID,
+}
+# レスポンスキャッシュ無効時は/healthの内容も固定
+_HEALTH_BYTES = orjson.dumps({**_HEALTH, "response_cache": {"enabled": False}})
+
+_ROOT_BYTES = orjson.dumps({
+    "service": "AgentCore Runtime Agent",
+    "model": MODEL_ID,
+    "region": AWS_REGION,
+    "status": "running",
+    "endpoints": [
+        "/health",
+        "/sessions",
+        "/agents/info",
+        "/agents/comparison",
+        "/agents/tools",
+        "/invocations",
+        "/invocations/stream",
+        "/ping",
+    ],
+})
+
+# これ以上のサイズのJSONはクライアントが対応していればgzip圧縮して返す
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESS_LEVEL = 5
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "")
+
+
+def _json_response(request: Request, content: bytes, gzipped: bytes | None = None) -> Response:
+    """JSONバイト列をレスポンスとして返す
+
+    gzipped が渡された場合（事前圧縮済み）はサイズに関わらずそれを使い、
+    それ以外はGZIP_MINIMUM_SIZE以上のときのみ都度圧縮する。
+    """
+    if gzipped is None and len(content) < GZIP_MINIMUM_SIZE:
+        return Response(content=content, media_type="application/json")
+    headers = {"vary": "Accept-Encoding"}
+    if _accepts_gzip(request):
+        headers["content-encoding"] = "gzip"
+        content = gzipped or gzip.compress(content, GZIP_COMPRESS_LEVEL)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+# InvocationResponse形式のエンベロープ（text, timestampのみ可変）
+_ENVELOPE_HEAD = b'{"output":{"message":{"role":"assistant","content":[{"text":'
+_ENVELOPE_MID = b'}]},"timestamp":"'
+_ENVELOPE_TAIL = b'"}}'
+
+
+def _envelope_prefix(payload: bytes) -> bytes:
+    """InvocationResponse形式のうちtimestamp直前までを事前構築"""
+    return _ENVELOPE_HEAD + orjson.dumps(payload.decode()) + _ENVELOPE_MID
+
+
+# アクションルーティング用: timestampのみ差し込めば完成するエンベロープ
+_STATIC_ACTION_ENVELOPES: dict[str, bytes] = {
+    "get_agent_info": _envelope_prefix(_AGENT_INFO_BYTES),
+    "get_agent_comparison": _envelope_prefix(_AGENT_COMPARISON_BYTES),
+    "get_agent_tools": _envelope_prefix(_AGENT_TOOLS_BYTES),
+}
+
+
+def _static_action_response(prefix: bytes) -> Response:
+    """事前構築済みエンベロープにtimestampを埋めてレスポンスを返す"""
+    return Response(
+        content=prefix + _cached_now().encode() + _ENVELOPE_TAIL,
+        media_type="application/json",
+    )
+
+
 # ===========================================
 # AgentCore必須エンドポイント
 # ===========================================
@@ -241,8 +959,13 @@ async def invoke_agent(request: InvocationRequest):
         
         # アクションベースルーティング
         if action:
+            static_envelope = _STATIC_ACTION_ENVELOPES.get(action)
+            if static_envelope is not None:
+                return _static_action_response(static_envelope)
             result = await handle_action(action, request.input)
-            return make_invocation_response(json.dumps(result, ensure_ascii=False, default=str))
+            return make_invocation_response(
+                orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+            )
         
         # 通常のチャット処理
         user_message = request.input.prompt or request.input.instruction
@@ -255,21 +978,12 @@ async def invoke_agent(request: InvocationRequest):
         
         logger.info(f"Processing invocation: {user_message[:100]}...")
         
-        result = strands_agent(user_message)
+        if request.input.stream:
+            return StreamingResponse(
+                _stream_agent(user_message), media_type="application/x-ndjson"
+            )
         
-        response_text = ""
-        if hasattr(result, "message"):
-            msg = result.message
-            if hasattr(msg, "content") and msg.content:
-                for content_item in msg.content:
-                    if hasattr(content_item, "text"):
-                        response_text += content_item.text
-                    elif isinstance(content_item, dict) and "text" in content_item:
-                        response_text += content_item["text"]
-            elif isinstance(msg, str):
-                response_text = msg
-        else:
-            response_text = str(result)
+        response_text = await generate_response(user_message)
         
         return make_invocation_response(response_text)
         
@@ -280,77 +994,153 @@ async def invoke_agent(request: InvocationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def make_invocation_response(text: str) -> dict:
-    """InvocationResponse形式のレスポンスを生成"""
-    return {
-        "output": {
-            "message": {
-                "role": "assistant",
-                "content": [{"text": text}],
-            },
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-    }
+@app.post("/invocations/stream")
+async def invoke_agent_stream(request: InvocationRequest):
+    """エージェント呼び出し（SSEストリーミング、チャットのみ）"""
+    user_message = request.input.prompt or request.input.instruction
+    if not user_message:
+        raise HTTPException(status_code=400, detail="No prompt found in input.")
+    
+    logger.info(f"Processing streaming invocation: {user_message[:100]}...")
+    return StreamingResponse(
+        _stream_agent_sse(user_message),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
+async def _agent_stream_events(
+    prompt: str, session_id: str | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Strands Agentの応答をイベントとして逐次返す
+
+    {"delta": ...} を順に返し、最後に {"done": true, ...} を返す（失敗時は {"error": ...}）。
+    session_id指定時は完了後に応答全文をアシスタントメッセージとして保存する。
+    """
+    parts: list[str] = []
+    try:
+        # 初回はBedrockModelの作成（ブロッキング）を伴うためスレッドで作成する
+        agent = await run_in_threadpool(create_agent)
+        async for event in agent.stream_async(prompt):
+            delta = event.get("data")
+            if isinstance(delta, str) and delta:
+                parts.append(delta)
+                yield {"delta": delta}
+    except Exception as e:
+        # ヘッダー送信後のためHTTPステータスでは返せない
+        logger.exception(f"Streaming failed: {e}")
+        yield {"error": str(e)}
+        return
+    
+    done: dict[str, Any] = {"done": True}
+    if session_id:
+        assistant_msg_id = token_hex(16)
+        await session_store.append_message(session_id, {
+            "id": assistant_msg_id,
+            "role": "assistant",
+            "content": "".join(parts),
+            "created_at": datetime.utcnow().isoformat(),
+        })
+        done["response_id"] = assistant_msg_id
+    yield done
+
+
+async def _stream_agent(
+    prompt: str, session_id: str | None = None
+) -> AsyncIterator[bytes]:
+    """Strands Agentの応答をNDJSONで逐次返す"""
+    async for event in _agent_stream_events(prompt, session_id):
+        yield orjson.dumps(event) + b"\n"
+
+
+async def _stream_agent_sse(
+    prompt: str, session_id: str | None = None
+) -> AsyncIterator[bytes]:
+    """Strands Agentの応答をServer-Sent Eventsで逐次返す"""
+    async for event in _agent_stream_events(prompt, session_id):
+        yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+# SSEをプロキシでバッファリングさせない
+_SSE_HEADERS = {"cache-control": "no-cache", "x-accel-buffering": "no"}
+
+
+def _extract_text(result: Any) -> str:
+    """Strands Agentのレスポンスからテキストを抽出
+
+    AgentResult.message はTypedDict（{"role": ..., "content": [{"text": ...}]}）のため
+    dictを優先して扱い、属性アクセスの形式にも対応する。
+    """
+    msg = getattr(result, "message", None)
+    if msg is None:
+        return str(result)
+
+    if isinstance(msg, dict):
+        content = msg.get("content")
+    else:
+        content = getattr(msg, "content", None)
+    if not content:
+        return msg if isinstance(msg, str) else ""
+
+    # 大半の応答は単一ブロック
+    if len(content) == 1:
+        return _block_text(content[0])
+
+    return "".join([_block_text(item) for item in content])
+
+
+def _block_text(item: Any) -> str:
+    """コンテンツブロックのテキスト（テキスト以外のブロックは空文字）"""
+    if isinstance(item, dict):
+        return item.get("text") or ""
+    return getattr(item, "text", None) or ""
+
+
+def make_invocation_response(text: str) -> Response:
+    """InvocationResponse形式のレスポンスを生成
+
+    形状は固定のため、dict構築とモデル検証を経ずにバイト列を直接組み立てる。
+    """
+    return Response(
+        content=_ENVELOPE_HEAD
+        + orjson.dumps(text)
+        + _ENVELOPE_MID
+        + _cached_now().encode()
+        + _ENVELOPE_TAIL,
+        media_type="application/json",
+    )
 
 
 async def handle_action(action: str, input_data: InvocationInput) -> dict:
     """アクションに応じた処理を実行"""
     logger.info(f"Handling action: {action}")
-    
-    # セッション関連
-    if action == "create_session":
-        return await _create_session(input_data)
-    elif action == "get_session":
-        return await _get_session(input_data.session_id)
-    elif action == "send_message":
-        return await _send_message(input_data)
-    elif action == "get_messages":
-        return await _get_messages(input_data)
-    elif action == "end_session":
-        return await _end_session(input_data.session_id)
-    
-    # エージェント情報
-    elif action == "get_agent_info":
-        return await _get_agent_info()
-    elif action == "get_agent_comparison":
-        return await _get_agent_comparison()
-    elif action == "get_agent_tools":
-        return await _get_agent_tools()
-    
-    # ヘルスチェック
-    elif action == "health_check":
-        return {"status": "healthy", "version": "1.0.0", "agent_type": "strands", "model_id": MODEL_ID}
-    
+
+    handler = _ACTION_HANDLERS.get(action)
+    if handler is not None:
+        return await handler(input_data)
+
     # サービス実行（runtime, memory, etc.）
-    elif action.startswith("service_") and action.endswith("_execute"):
-        service_name = action.replace("service_", "").replace("_execute", "")
+    if action.startswith("service_") and action.endswith("_execute"):
+        service_name = action[len("service_"):-len("_execute")]
         return await _execute_service(service_name, input_data)
-    
-    # ベンチマーク
-    elif action == "run_benchmark":
-        return await _run_benchmark(input_data)
-    elif action == "get_benchmark_results":
-        return {"results": []}  # TODO: 実装
-    
-    else:
-        raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+
+    raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
 
 
 async def _create_session(input_data: InvocationInput) -> dict:
     """セッション作成"""
-    session_id = str(uuid.uuid4())
+    session_id = token_hex(16)
     agent_id = input_data.agent_id or "strands-agent"
-    created_at = datetime.utcnow().isoformat()
+    created_at = _cached_now()
     
-    sessions[session_id] = {
+    await session_store.create({
         "session_id": session_id,
         "agent_id": agent_id,
         "user_id": input_data.user_id,
         "agent_type": input_data.agent_type or "strands",
         "state": "active",
         "created_at": created_at,
-        "messages": [],
-    }
+    })
     
     logger.info(f"Session created: {session_id}")
     
@@ -364,73 +1154,66 @@ async def _create_session(input_data: InvocationInput) -> dict:
 
 async def _get_session(session_id: str | None) -> dict:
     """セッション取得"""
-    if not session_id or session_id not in sessions:
+    session = await session_store.get(session_id) if session_id else None
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
     return {
         "session_id": session["session_id"],
         "agent_id": session["agent_id"],
         "agent_type": session.get("agent_type", "strands"),
         "state": session["state"],
         "created_at": session["created_at"],
-        "message_count": len(session["messages"]),
+        "message_count": session["message_count"],
     }
 
 
+async def _append_user_message(session_id: str, instruction: str) -> None:
+    """ユーザーメッセージを保存（セッションが存在しない場合は404）"""
+    appended = await session_store.append_message(session_id, {
+        "id": token_hex(16),
+        "role": "user",
+        "content": instruction,
+        "created_at": datetime.utcnow().isoformat(),
+    })
+    if not appended:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+
 async def _send_message(input_data: InvocationInput) -> dict:
     """メッセージ送信"""
     session_id = input_data.session_id
     instruction = input_data.instruction or input_data.prompt
     
-    if not session_id or session_id not in sessions:
+    if not session_id:
         raise HTTPException(status_code=404, detail="Session not found")
     
     if not instruction:
         raise HTTPException(status_code=400, detail="No instruction provided")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # ユーザーメッセージを保存
-    user_msg_id = str(uuid.uuid4())
-    sessions[session_id]["messages"].append({
-        "id": user_msg_id,
-        "role": "user",
-        "content": instruction,
-        "created_at": datetime.utcnow().isoformat(),
-    })
+    await _append_user_message(session_id, instruction)
     
     # Strands Agentで応答生成
     logger.info(f"Processing message in session {session_id}: {instruction[:100]}...")
-    result = strands_agent(instruction)
-    
-    # レスポンス抽出
-    response_text = ""
-    if hasattr(result, "message"):
-        msg = result.message
-        if hasattr(msg, "content") and msg.content:
-            for content_item in msg.content:
-                if hasattr(content_item, "text"):
-                    response_text += content_item.text
-                elif isinstance(content_item, dict) and "text" in content_item:
-                    response_text += content_item["text"]
-        elif isinstance(msg, str):
-            response_text = msg
-    else:
-        response_text = str(result)
+    llm_start = time.perf_counter()
+    response_text = await generate_response(instruction)
+    llm_latency_ms = int((time.perf_counter() - llm_start) * 1000)
     
-    latency_ms = int((time.time() - start_time) * 1000)
+    latency_ms = int((time.perf_counter() - start_time) * 1000)
     
     # アシスタントメッセージを保存
-    assistant_msg_id = str(uuid.uuid4())
-    sessions[session_id]["messages"].append({
+    assistant_msg_id = token_hex(16)
+    await session_store.append_message(session_id, {
         "id": assistant_msg_id,
         "role": "assistant",
         "content": response_text,
         "created_at": datetime.utcnow().isoformat(),
     })
     
-    logger.info(f"Response generated in {latency_ms}ms")
+    logger.info(f"Response generated in {latency_ms}ms (llm: {llm_latency_ms}ms)")
     
     return {
         "response_id": assistant_msg_id,
@@ -440,6 +1223,7 @@ async def _send_message(input_data: InvocationInput) -> dict:
         "metadata": {
             "model_id": MODEL_ID,
             "provider": "strands",
+            "llm_latency_ms": llm_latency_ms,
         },
     }
 
@@ -450,90 +1234,27 @@ async def _get_messages(input_data: InvocationInput) -> dict:
     limit = input_data.limit or 50
     offset = input_data.offset or 0
     
-    if not session_id or session_id not in sessions:
+    page = await session_store.get_messages(session_id, offset, limit) if session_id else None
+    if page is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    messages = sessions[session_id]["messages"]
+    messages, total_count = page
     return {
-        "messages": messages[offset:offset + limit],
-        "total_count": len(messages),
+        "messages": messages,
+        "total_count": total_count,
     }
 
 
 async def _end_session(session_id: str | None) -> dict:
     """セッション終了"""
-    if not session_id or session_id not in sessions:
+    if not session_id or not await session_store.set_state(session_id, "ended"):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    sessions[session_id]["state"] = "ended"
     logger.info(f"Session ended: {session_id}")
     
     return {"status": "ended", "session_id": session_id}
 
 
-async def _get_agent_info() -> dict:
-    """エージェント情報"""
-    return {
-        "agent_type": "strands",
-        "model_id": MODEL_ID,
-        "provider": "AWS Bedrock AgentCore",
-        "capabilities": ["conversation", "tool_use", "memory", "streaming"],
-    }
-
-
-async def _get_agent_comparison() -> dict:
-    """エージェント比較"""
-    return {
-        "strands": {
-            "name": "AWS Strands Agents",
-            "strengths": [
-                "AWS Bedrockネイティブ統合",
-                "AgentCore Memory/Identity連携",
-                "サーバーレス実行",
-                "エンタープライズセキュリティ",
-            ],
-            "features": {
-                "bedrock_native": True,
-                "memory_api": True,
-                "serverless": True,
-                "multi_provider": False,
-                "open_source": True,
-            },
-        },
-        "langchain": {
-            "name": "LangChain + LangGraph",
-            "strengths": [
-                "豊富なエコシステム",
-                "マルチプロバイダー対応",
-                "柔軟なワークフロー",
-                "コミュニティサポート",
-            ],
-            "features": {
-                "bedrock_native": False,
-                "memory_api": False,
-                "serverless": False,
-                "multi_provider": True,
-                "open_source": True,
-            },
-        },
-    }
-
-
-async def _get_agent_tools() -> dict:
-    """ツール一覧"""
-    return {
-        "agent_type": "strands",
-        "tools": [
-            {"name": "get_current_weather", "description": "現在の天気を取得", "available": True},
-            {"name": "search_documents", "description": "ドキュメント検索", "available": True},
-            {"name": "calculate", "description": "数式計算", "available": True},
-            {"name": "create_task", "description": "タスク作成", "available": True},
-            {"name": "fetch_url", "description": "URL取得", "available": True},
-        ],
-        "total_count": 5,
-    }
-
-
 async def _execute_service(service_name: str, input_data: InvocationInput) -> dict:
     """サービス実行"""
     instruction = input_data.instruction or input_data.prompt
@@ -541,31 +1262,19 @@ async def _execute_service(service_name: str, input_data: InvocationInput) -> di
     if not instruction:
         raise HTTPException(status_code=400, detail="No instruction provided")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     logger.info(f"Executing service '{service_name}': {instruction[:100]}...")
     
     # Strands Agentで処理
-    result = strands_agent(instruction)
-    
-    response_text = ""
-    if hasattr(result, "message"):
-        msg = result.message
-        if hasattr(msg, "content") and msg.content:
-            for content_item in msg.content:
-                if hasattr(content_item, "text"):
-                    response_text += content_item.text
-                elif isinstance(content_item, dict) and "text" in content_item:
-                    response_text += content_item["text"]
-        elif isinstance(msg, str):
-            response_text = msg
-    else:
-        response_text = str(result)
+    llm_start = time.perf_counter()
+    response_text = await generate_response(instruction)
+    llm_latency_ms = int((time.perf_counter() - llm_start) * 1000)
     
-    latency_ms = int((time.time() - start_time) * 1000)
+    latency_ms = int((time.perf_counter() - start_time) * 1000)
     
     return {
-        "response_id": str(uuid.uuid4()),
+        "response_id": token_hex(16),
         "content": response_text,
         "tool_calls": None,
         "latency_ms": latency_ms,
@@ -573,45 +1282,107 @@ async def _execute_service(service_name: str, input_data: InvocationInput) -> di
             "service": service_name,
             "model_id": MODEL_ID,
             "provider": "strands",
+            "llm_latency_ms": llm_latency_ms,
         },
     }
 
 
+# ベンチマークの入力上限と同時実行数（本番トラフィックのスレッドプールを食い潰さないため）
+MAX_BENCHMARK_CASES = 64
+MAX_BENCHMARK_ITERATIONS = 10
+BENCHMARK_CONCURRENCY = int(os.getenv("BENCHMARK_CONCURRENCY", "4"))
+_benchmark_semaphore = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+
+
 async def _run_benchmark(input_data: InvocationInput) -> dict:
-    """ベンチマーク実行"""
+    """ベンチマーク実行
+
+    各テストケースは独立したBedrock呼び出しのため並列に実行する。
+    同一ケースはiterations回順に実行し、各回のレイテンシと平均を返す。
+    同時実行数はBENCHMARK_CONCURRENCYで制限する。
+    """
     test_cases = input_data.test_cases or []
     iterations = input_data.iterations or 1
+    if len(test_cases) > MAX_BENCHMARK_CASES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"test_cases must be at most {MAX_BENCHMARK_CASES}",
+        )
+    if not 1 <= iterations <= MAX_BENCHMARK_ITERATIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"iterations must be between 1 and {MAX_BENCHMARK_ITERATIONS}",
+        )
     
-    results = []
-    for test_case in test_cases:
-        start_time = time.time()
-        try:
-            result = strands_agent(test_case)
-            response_text = str(result)
-            success = True
-        except Exception as e:
-            response_text = str(e)
-            success = False
-        
-        latency_ms = int((time.time() - start_time) * 1000)
+    async def run_once(test_case: str) -> tuple[int, bool, str]:
+        # 待ち時間を計測に含めないよう、セマフォ取得後に計測を開始する
+        async with _benchmark_semaphore:
+            start_time = time.perf_counter()
+            try:
+                result = await run_in_threadpool(run_agent, test_case)
+                response_text = str(result)
+                success = True
+            except Exception as e:
+                response_text = str(e)
+                success = False
+            
+            latency_ms = int((time.perf_counter() - start_time) * 1000)
+        return latency_ms, success, response_text
+    
+    async def run_case(test_case: str) -> dict:
+        latencies = []
+        success = True
+        response_text = ""
+        for _ in range(iterations):
+            latency_ms, ok, response_text = await run_once(test_case)
+            latencies.append(latency_ms)
+            success = success and ok
         
-        results.append({
+        return {
             "test_name": test_case[:50],
-            "strands_latency_ms": latency_ms,
+            "iterations": iterations,
+            "strands_latency_ms": sum(latencies) // iterations,
+            "strands_latencies_ms": latencies,
             "langchain_latency_ms": 0,  # LangChain未実装
             "strands_success": success,
             "langchain_success": False,
             "strands_response": response_text[:500],
             "langchain_response": None,
-        })
+        }
     
-    return {"results": results}
+    results = await asyncio.gather(*(run_case(test_case) for test_case in test_cases))
+    return {"results": list(results)}
+
+
+async def _health_check(input_data: InvocationInput) -> dict:
+    return _HEALTH
+
+
+async def _get_benchmark_results(input_data: InvocationInput) -> dict:
+    return {"results": []}  # TODO: 実装
+
+
+# アクション名 → ハンドラ（すべてInvocationInputを受け取るコルーチン関数）
+# エージェント情報系（get_agent_*）は_STATIC_ACTION_ENVELOPESで応答する
+_ACTION_HANDLERS: dict[str, Callable[[InvocationInput], Awaitable[dict]]] = {
+    # セッション関連
+    "create_session": _create_session,
+    "get_session": lambda d: _get_session(d.session_id),
+    "send_message": _send_message,
+    "get_messages": _get_messages,
+    "end_session": lambda d: _end_session(d.session_id),
+    # ヘルスチェック
+    "health_check": _health_check,
+    # ベンチマーク
+    "run_benchmark": _run_benchmark,
+    "get_benchmark_results": _get_benchmark_results,
+}
 
 
 @app.get("/ping")
 async def ping():
     """ヘルスチェック (AgentCore必須)"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return Response(content=_ping_cache[0], media_type="application/json")
 
 
 # ===========================================
@@ -621,12 +1392,9 @@ async def ping():
 @app.get("/health")
 async def health():
     """ヘルスチェック（ダッシュボード用）"""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "agent_type": "strands",
-        "model_id": MODEL_ID,
-    }
+    if response_cache is None:
+        return Response(content=_HEALTH_BYTES, media_type="application/json")
+    return {**_HEALTH, "response_cache": response_cache.stats()}
 
 
 # ===========================================
@@ -636,130 +1404,157 @@ async def health():
 @app.post("/sessions", response_model=CreateSessionResponse)
 async def create_session(request: CreateSessionRequest):
     """セッション作成"""
-    session_id = str(uuid.uuid4())
+    session_id = token_hex(16)
     agent_id = request.agent_id or "strands-agent"
-    created_at = datetime.utcnow().isoformat()
+    created_at = _cached_now()
     
-    sessions[session_id] = {
+    await session_store.create({
         "session_id": session_id,
         "agent_id": agent_id,
         "user_id": request.user_id,
         "state": "active",
         "created_at": created_at,
-        "messages": [],
-    }
+    })
     
     logger.info(f"Session created: {session_id}")
     
-    return CreateSessionResponse(
-        session_id=session_id,
-        agent_id=agent_id,
-        created_at=created_at,
-    )
+    return {
+        "session_id": session_id,
+        "agent_id": agent_id,
+        "created_at": created_at,
+    }
 
 
-@app.get("/sessions/{session_id}", response_model=SessionInfo)
+@app.get("/sessions/{session_id}", responses={200: {"model": SessionInfo}})
 async def get_session(session_id: str):
-    """セッション取得"""
-    if session_id not in sessions:
+    """セッション取得
+
+    ストアから取得した値をそのまま返すため、レスポンスモデルでの再検証は行わない。
+    """
+    session = await session_store.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = sessions[session_id]
-    return SessionInfo(
-        session_id=session["session_id"],
-        agent_id=session["agent_id"],
-        state=session["state"],
-        created_at=session["created_at"],
-        message_count=len(session["messages"]),
-    )
+    return {
+        "session_id": session["session_id"],
+        "agent_id": session["agent_id"],
+        "state": session["state"],
+        "created_at": session["created_at"],
+        "message_count": session["message_count"],
+    }
+
+
+_MESSAGES_CACHE_HEADERS = {"cache-control": "private, max-age=1"}
+
 
+def _weak_etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-MatchとETagを弱い比較（W/を無視）で照合する"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
 
-@app.get("/sessions/{session_id}/messages", response_model=MessagesResponse)
-async def get_messages(session_id: str, limit: int = 50, offset: int = 0):
-    """セッションのメッセージ取得"""
-    if session_id not in sessions:
+
+@app.get("/sessions/{session_id}/messages", responses={200: {"model": MessagesResponse}})
+async def get_messages(request: Request, session_id: str, limit: int = 50, offset: int = 0):
+    """セッションのメッセージ取得
+
+    メッセージは保存時点で構築済みのdictのため、レスポンスモデルでの再検証は行わない。
+    履歴が長い場合はgzip圧縮して返す。
+    メッセージは追記のみのため、同じページ指定（offset/limit）で総件数と末尾IDが同じなら
+    内容も同じとみなしてETagとし、ポーリング時の再取得には304を返す。
+    gzip有無で本文のバイト列が変わるため、ETagは弱い検証子とする。
+    1秒以内の再ポーリングはブラウザキャッシュで吸収する。
+    """
+    page = await session_store.get_messages(session_id, offset, limit)
+    if page is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    messages = sessions[session_id]["messages"]
-    return MessagesResponse(
-        messages=messages[offset:offset + limit],
-        total_count=len(messages),
+    messages, total_count = page
+    last_id = messages[-1]["id"] if messages else ""
+    etag = f'W/"{total_count}-{offset}-{limit}-{last_id}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _weak_etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"etag": etag, **_MESSAGES_CACHE_HEADERS})
+    
+    response = _json_response(
+        request,
+        orjson.dumps({"messages": messages, "total_count": total_count}),
     )
+    response.headers["etag"] = etag
+    response.headers.update(_MESSAGES_CACHE_HEADERS)
+    return response
 
 
 @app.post("/sessions/{session_id}/messages", response_model=SendMessageResponse)
 async def send_message(session_id: str, request: SendMessageRequest):
     """メッセージ送信 & AI応答"""
-    if session_id not in sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
+    start_time = time.perf_counter()
+    await _append_user_message(session_id, request.instruction)
     
-    start_time = time.time()
-    
-    # ユーザーメッセージを保存
-    user_msg_id = str(uuid.uuid4())
-    sessions[session_id]["messages"].append(SessionMessage(
-        id=user_msg_id,
-        role="user",
-        content=request.instruction,
-        created_at=datetime.utcnow().isoformat(),
-    ))
+    if request.stream:
+        return StreamingResponse(
+            _stream_agent(request.instruction, session_id=session_id),
+            media_type="application/x-ndjson",
+        )
     
     try:
         # Strands Agentで応答生成
         logger.info(f"Processing message in session {session_id}: {request.instruction[:100]}...")
-        result = strands_agent(request.instruction)
-        
-        # レスポンス抽出
-        response_text = ""
-        if hasattr(result, "message"):
-            msg = result.message
-            if hasattr(msg, "content") and msg.content:
-                for content_item in msg.content:
-                    if hasattr(content_item, "text"):
-                        response_text += content_item.text
-                    elif isinstance(content_item, dict) and "text" in content_item:
-                        response_text += content_item["text"]
-            elif isinstance(msg, str):
-                response_text = msg
-        else:
-            response_text = str(result)
+        llm_start = time.perf_counter()
+        response_text = await generate_response(request.instruction)
+        llm_latency_ms = int((time.perf_counter() - llm_start) * 1000)
         
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = int((time.perf_counter() - start_time) * 1000)
         
         # アシスタントメッセージを保存
-        assistant_msg_id = str(uuid.uuid4())
-        sessions[session_id]["messages"].append(SessionMessage(
-            id=assistant_msg_id,
-            role="assistant",
-            content=response_text,
-            created_at=datetime.utcnow().isoformat(),
-        ))
+        assistant_msg_id = token_hex(16)
+        await session_store.append_message(session_id, {
+            "id": assistant_msg_id,
+            "role": "assistant",
+            "content": response_text,
+            "created_at": datetime.utcnow().isoformat(),
+        })
         
-        logger.info(f"Response generated in {latency_ms}ms")
+        logger.info(f"Response generated in {latency_ms}ms (llm: {llm_latency_ms}ms)")
         
-        return SendMessageResponse(
-            response_id=assistant_msg_id,
-            content=response_text,
-            tool_calls=None,
-            latency_ms=latency_ms,
-            metadata={
+        return {
+            "response_id": assistant_msg_id,
+            "content": response_text,
+            "tool_calls": None,
+            "latency_ms": latency_ms,
+            "metadata": {
                 "model_id": MODEL_ID,
                 "provider": "strands",
+                "llm_latency_ms": llm_latency_ms,
             },
-        )
+        }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Message processing failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/sessions/{session_id}/messages/stream")
+async def send_message_stream(session_id: str, request: SendMessageRequest):
+    """メッセージ送信 & AI応答（SSEストリーミング）"""
+    await _append_user_message(session_id, request.instruction)
+    
+    return StreamingResponse(
+        _stream_agent_sse(request.instruction, session_id=session_id),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
+
 @app.delete("/sessions/{session_id}")
 async def end_session(session_id: str):
     """セッション終了"""
-    if session_id not in sessions:
+    if not await session_store.set_state(session_id, "ended"):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    sessions[session_id]["state"] = "ended"
     logger.info(f"Session ended: {session_id}")
     
     return {"status": "ended", "session_id": session_id}
@@ -769,75 +1564,25 @@ async def end_session(session_id: str):
 # Agents API
 # ===========================================
 
-@app.get("/agents/info", response_model=AgentInfo)
+# いずれも事前エンコード済みの固定レスポンスのため、スキーマはOpenAPI用に
+# responsesでのみ宣言し、response_modelによる検証は行わない
+
+@app.get("/agents/info", responses={200: {"model": AgentInfo}})
 async def get_agent_info():
     """エージェント情報"""
-    return AgentInfo(
-        agent_type="strands",
-        model_id=MODEL_ID,
-        provider="AWS Bedrock AgentCore",
-        capabilities=[
-            "conversation",
-            "tool_use",
-            "memory",
-            "streaming",
-        ],
-    )
+    return Response(content=_AGENT_INFO_BYTES, media_type="application/json")
 
 
-@app.get("/agents/comparison", response_model=AgentComparison)
-async def get_agent_comparison():
+@app.get("/agents/comparison", responses={200: {"model": AgentComparison}})
+async def get_agent_comparison(request: Request):
     """エージェント比較（Strands vs LangChain）"""
-    return AgentComparison(
-        strands=AgentFeatures(
-            name="AWS Strands Agents",
-            strengths=[
-                "AWS Bedrockネイティブ統合",
-                "AgentCore Memory/Identity連携",
-                "サーバーレス実行",
-                "エンタープライズセキュリティ",
-            ],
-            features={
-                "bedrock_native": True,
-                "memory_api": True,
-                "serverless": True,
-                "multi_provider": False,
-                "open_source": True,
-            },
-        ),
-        langchain=AgentFeatures(
-            name="LangChain + LangGraph",
-            strengths=[
-                "豊富なエコシステム",
-                "マルチプロバイダー対応",
-                "柔軟なワークフロー",
-                "コミュニティサポート",
-            ],
-            features={
-                "bedrock_native": False,
-                "memory_api": False,
-                "serverless": False,
-                "multi_provider": True,
-                "open_source": True,
-            },
-        ),
-    )
+    return _json_response(request, _AGENT_COMPARISON_BYTES, gzipped=_AGENT_COMPARISON_GZ)
 
 
-@app.get("/agents/tools", response_model=ToolsResponse)
+@app.get("/agents/tools", responses={200: {"model": ToolsResponse}})
 async def get_agent_tools():
     """利用可能ツール"""
-    return ToolsResponse(
-        agent_type="strands",
-        tools=[
-            ToolInfo(name="get_current_weather", description="現在の天気を取得", available=True),
-            ToolInfo(name="search_documents", description="ドキュメント検索", available=True),
-            ToolInfo(name="calculate", description="数式計算", available=True),
-            ToolInfo(name="create_task", description="タスク作成", available=True),
-            ToolInfo(name="fetch_url", description="URL取得", available=True),
-        ],
-        total_count=5,
-    )
+    return Response(content=_AGENT_TOOLS_BYTES, media_type="application/json")
 
 
 # ===========================================
@@ -847,21 +1592,7 @@ async def get_agent_tools():
 @app.get("/")
 async def root():
     """ルートエンドポイント"""
-    return {
-        "service": "AgentCore Runtime Agent",
-        "model": MODEL_ID,
-        "region": AWS_REGION,
-        "status": "running",
-        "endpoints": [
-            "/health",
-            "/sessions",
-            "/agents/info",
-            "/agents/comparison",
-            "/agents/tools",
-            "/invocations",
-            "/ping",
-        ],
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # ===========================================
@@ -870,5 +1601,30 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
+
+    # uvloop + httptools (uvicorn[standard]) を優先し、
+    # 未対応環境（Windows等）ではasyncioにフォールバック
+    try:
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "auto"
+
+    # セッションをワーカー間で共有できるRedis使用時のみマルチワーカーにする
+    default_workers = (os.cpu_count() or 2) if REDIS_URL else 1
+    workers = int(os.getenv("WEB_CONCURRENCY", str(default_workers)))
+    if workers > 1 and not REDIS_URL:
+        logger.warning("REDIS_URL is not set; sessions are not shared between workers")
+
     port = int(os.getenv("PORT", "8080"))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # マルチワーカーではアプリをインポート文字列で渡す必要がある
+    uvicorn.run(
+        "agent:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        log_level="info",
+    )
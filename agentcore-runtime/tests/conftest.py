@@ -0,0 +1,15 @@
+"""Pytest Configuration and Fixtures"""
+
+import agent
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+
+@pytest.fixture
+async def client():
+    """テスト用HTTPクライアント（lifespanは実行しない）"""
+    async with AsyncClient(
+        transport=ASGITransport(app=agent.app),
+        base_url="http://test",
+    ) as client:
+        yield client
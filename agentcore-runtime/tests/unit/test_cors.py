@@ -0,0 +1,49 @@
+"""CORS Middleware Tests"""
+
+import agent
+import pytest
+
+SESSION_HEADER = "x-amzn-bedrock-agentcore-runtime-session-id"
+
+
+def _preflight_headers(request_headers: str) -> dict[str, str]:
+    return {
+        "origin": "http://localhost:3000",
+        "access-control-request-method": "POST",
+        "access-control-request-headers": request_headers,
+    }
+
+
+@pytest.fixture
+def restricted_origins(monkeypatch):
+    """ALLOWED_ORIGINS=http://localhost:3000 相当に切り替える"""
+    monkeypatch.setattr(agent, "_CORS_ALLOW_ALL", False)
+    monkeypatch.setattr(agent, "_CORS_ORIGINS", frozenset([b"http://localhost:3000"]))
+
+
+class TestCORSPreflight:
+    @pytest.mark.asyncio
+    async def test_allow_all_echoes_requested_headers(self, client, monkeypatch):
+        monkeypatch.setattr(agent, "_CORS_ALLOW_ALL", True)
+        requested = f"content-type, {SESSION_HEADER}, x-custom"
+        response = await client.options("/invocations", headers=_preflight_headers(requested))
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-headers"] == requested
+
+    @pytest.mark.asyncio
+    async def test_allowlist_permits_session_id_header(self, client, restricted_origins):
+        response = await client.options(
+            "/invocations", headers=_preflight_headers(f"authorization, {SESSION_HEADER}")
+        )
+        assert response.status_code == 200
+        allowed = {
+            h.strip() for h in response.headers["access-control-allow-headers"].split(",")
+        }
+        assert {"content-type", "authorization", SESSION_HEADER} <= allowed
+
+    @pytest.mark.asyncio
+    async def test_allowlist_rejects_unknown_origin(self, client, restricted_origins):
+        response = await client.get("/ping", headers={"origin": "http://evil.example"})
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
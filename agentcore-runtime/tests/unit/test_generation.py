@@ -0,0 +1,119 @@
+"""Model Invocation Tests"""
+
+import asyncio
+import time
+
+import agent
+import pytest
+from fastapi import HTTPException
+
+
+class TestRunAgentWithTimeout:
+    @pytest.mark.asyncio
+    async def test_retries_then_returns_504(self, monkeypatch):
+        calls = []
+
+        def slow_agent(prompt):
+            calls.append(prompt)
+            time.sleep(0.2)
+
+        monkeypatch.setattr(agent, "run_agent", slow_agent)
+        monkeypatch.setattr(agent, "BEDROCK_TIMEOUT_S", 0.01)
+        monkeypatch.setattr(agent, "BEDROCK_MAX_RETRIES", 2)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await agent.run_agent_with_timeout("hi")
+        assert exc_info.value.status_code == 504
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_succeeds_after_timeout(self, monkeypatch):
+        calls = []
+
+        def flaky_agent(prompt):
+            calls.append(prompt)
+            if len(calls) == 1:
+                time.sleep(0.2)
+            return "ok"
+
+        monkeypatch.setattr(agent, "run_agent", flaky_agent)
+        monkeypatch.setattr(agent, "BEDROCK_TIMEOUT_S", 0.05)
+        monkeypatch.setattr(agent, "BEDROCK_MAX_RETRIES", 1)
+
+        assert await agent.run_agent_with_timeout("hi") == "ok"
+        assert len(calls) == 2
+
+
+class TestGenerateResponse:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_prompts_share_one_call(self, monkeypatch):
+        calls = []
+
+        async def fake_run(prompt):
+            calls.append(prompt)
+            await asyncio.sleep(0.01)
+            return f"echo:{prompt}"
+
+        monkeypatch.setattr(agent, "run_agent_with_timeout", fake_run)
+        monkeypatch.setattr(agent, "response_cache", None)
+
+        results = await asyncio.gather(*(agent.generate_response("p") for _ in range(3)))
+        assert results == ["echo:p"] * 3
+        assert calls == ["p"]
+        assert agent._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_kept_inflight(self, monkeypatch):
+        async def failing_run(prompt):
+            raise HTTPException(status_code=504, detail="timeout")
+
+        monkeypatch.setattr(agent, "run_agent_with_timeout", failing_run)
+        monkeypatch.setattr(agent, "response_cache", None)
+
+        with pytest.raises(HTTPException):
+            await agent.generate_response("p")
+        await asyncio.sleep(0)
+        assert agent._inflight == {}
+
+
+class TestRunBenchmark:
+    @pytest.mark.asyncio
+    async def test_runs_each_case_iterations_times(self, monkeypatch):
+        calls = []
+
+        def fake_agent(prompt):
+            calls.append(prompt)
+            return f"echo:{prompt}"
+
+        monkeypatch.setattr(agent, "run_agent", fake_agent)
+        result = await agent._run_benchmark(
+            agent.InvocationInput(test_cases=["a", "b"], iterations=3)
+        )
+
+        assert sorted(calls) == ["a"] * 3 + ["b"] * 3
+        for case in result["results"]:
+            assert case["iterations"] == 3
+            assert len(case["strands_latencies_ms"]) == 3
+            assert case["strands_success"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("iterations", [-1, agent.MAX_BENCHMARK_ITERATIONS + 1])
+    async def test_rejects_out_of_range_iterations(self, iterations):
+        with pytest.raises(HTTPException) as exc_info:
+            await agent._run_benchmark(
+                agent.InvocationInput(test_cases=["a"], iterations=iterations)
+            )
+        assert exc_info.value.status_code == 400
+
+
+class TestModelWarmUp:
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_not_raised(self, monkeypatch, caplog):
+        def failing_model():
+            raise RuntimeError("no credentials")
+
+        monkeypatch.setattr(agent, "get_bedrock_model", failing_model)
+
+        await agent._warm_up_model()
+
+        assert "Bedrock model warm-up failed: no credentials" in caplog.text
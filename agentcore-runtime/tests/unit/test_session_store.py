@@ -0,0 +1,112 @@
+"""Session Store Tests
+
+InMemorySessionStore と RedisSessionStore が同じクエリに同じ結果を返すことを確認する。
+"""
+
+import agent
+import pytest
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """RedisSessionStoreの接続先をfakeredisに差し替える"""
+    fakeredis = pytest.importorskip("fakeredis")
+    import redis.asyncio
+
+    monkeypatch.setattr(
+        redis.asyncio, "from_url", lambda url, **kwargs: fakeredis.FakeAsyncRedis(**kwargs)
+    )
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def store(request):
+    """メッセージ上限3件のセッションストア"""
+    if request.param == "memory":
+        yield agent.InMemorySessionStore(max_messages=3)
+        return
+    request.getfixturevalue("fake_redis")
+    store = agent.RedisSessionStore("redis://test", max_messages=3)
+    yield store
+    await store._redis.aclose()
+
+
+async def _create_with_messages(store, count: int) -> None:
+    await store.create({"session_id": "s1", "agent_id": "a", "state": "active"})
+    for i in range(count):
+        await store.append_message("s1", {"id": f"m{i}"})
+
+
+def _ids(page) -> list[str]:
+    messages, _ = page
+    return [m["id"] for m in messages]
+
+
+class TestSessionStore:
+    @pytest.mark.asyncio
+    async def test_missing_session(self, store):
+        assert await store.get("missing") is None
+        assert await store.get_messages("missing", 0, 10) is None
+        assert await store.append_message("missing", {"id": "m"}) is False
+        assert await store.set_state("missing", "ended") is False
+
+    @pytest.mark.asyncio
+    async def test_pagination(self, store):
+        await _create_with_messages(store, 3)
+        assert _ids(await store.get_messages("s1", 0, 2)) == ["m0", "m1"]
+        assert _ids(await store.get_messages("s1", 2, 2)) == ["m2"]
+        assert _ids(await store.get_messages("s1", 5, 2)) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_non_positive_limit_returns_empty_page(self, store, limit):
+        await _create_with_messages(store, 3)
+        assert await store.get_messages("s1", 0, limit) == ([], 3)
+
+    @pytest.mark.asyncio
+    async def test_negative_offset_is_clamped(self, store):
+        await _create_with_messages(store, 3)
+        assert _ids(await store.get_messages("s1", -1, 2)) == ["m0", "m1"]
+
+    @pytest.mark.asyncio
+    async def test_history_is_trimmed_with_sequence_offsets(self, store):
+        """上限を超えた古いメッセージは破棄し、offsetと件数は通し番号のままとする"""
+        await _create_with_messages(store, 5)
+        assert (await store.get("s1"))["message_count"] == 5
+        assert await store.get_messages("s1", 0, 10) == (
+            [{"id": "m2"}, {"id": "m3"}, {"id": "m4"}],
+            5,
+        )
+        assert _ids(await store.get_messages("s1", 3, 1)) == ["m3"]
+
+    @pytest.mark.asyncio
+    async def test_set_state(self, store):
+        await _create_with_messages(store, 0)
+        assert await store.set_state("s1", "ended") is True
+        assert (await store.get("s1"))["state"] == "ended"
+
+
+class TestRedisSessionTTL:
+    @pytest.mark.asyncio
+    async def test_append_refreshes_both_keys(self, fake_redis):
+        """メッセージ追加でセッション情報とメッセージの両方のTTLが延長されること"""
+        store = agent.RedisSessionStore("redis://test", ttl=100)
+        try:
+            await store.create({"session_id": "s1", "agent_id": "a", "state": "active"})
+            await store._redis.expire(store._key("s1"), 5)  # 作成から時間が経過した状態
+
+            assert await store.append_message("s1", {"id": "m0"}) is True
+            assert await store._redis.ttl(store._key("s1")) > 5
+            assert await store._redis.ttl(store._msgs_key("s1")) > 5
+        finally:
+            await store._redis.aclose()
+
+
+class TestRedisKeys:
+    def test_keys_share_cluster_hash_slot(self):
+        """Luaスクリプトが扱う2キーがRedis Clusterで同一スロットになること"""
+        from redis.crc import key_slot
+
+        key = agent.RedisSessionStore._key("s1")
+        msgs_key = agent.RedisSessionStore._msgs_key("s1")
+        assert key == "sess:{s1}"
+        assert key_slot(key.encode()) == key_slot(msgs_key.encode())
@@ -0,0 +1,50 @@
+"""Sessions API Tests"""
+
+import agent
+import pytest
+
+
+@pytest.fixture
+async def session_id(monkeypatch):
+    """メッセージ3件を持つセッションを作成する"""
+    store = agent.InMemorySessionStore()
+    monkeypatch.setattr(agent, "session_store", store)
+    await store.create({"session_id": "s1", "agent_id": "a", "state": "active"})
+    for i in range(3):
+        await store.append_message("s1", {"id": f"m{i}", "role": "user", "content": str(i)})
+    return "s1"
+
+
+class TestMessagesETag:
+    @pytest.mark.asyncio
+    async def test_not_modified_for_same_page(self, client, session_id):
+        first = await client.get(f"/sessions/{session_id}/messages?limit=1")
+        assert first.status_code == 200
+        response = await client.get(
+            f"/sessions/{session_id}/messages?limit=1",
+            headers={"if-none-match": first.headers["etag"]},
+        )
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_different_page_is_not_304(self, client, session_id):
+        """offset/limitの異なるページに同じETagを使い回しても304を返さないこと"""
+        full = await client.get(f"/sessions/{session_id}/messages")
+        response = await client.get(
+            f"/sessions/{session_id}/messages?offset=1",
+            headers={"if-none-match": full.headers["etag"]},
+        )
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()["messages"]] == ["m1", "m2"]
+
+    @pytest.mark.asyncio
+    async def test_etag_is_weak_and_matches_strong_form(self, client, session_id):
+        """gzip有無で本文が変わるため弱いETagを返し、W/なしのタグとも一致すること"""
+        first = await client.get(f"/sessions/{session_id}/messages")
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        response = await client.get(
+            f"/sessions/{session_id}/messages",
+            headers={"if-none-match": f'"other", {etag.removeprefix("W/")}'},
+        )
+        assert response.status_code == 304
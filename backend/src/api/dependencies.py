@@ -20,7 +20,7 @@ import os
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 
 from application.handlers.command_handlers import (
     EndSessionHandler,
@@ -71,14 +71,26 @@ class Settings:
         self.agent_runtime_qualifier = os.getenv("AGENT_RUNTIME_QUALIFIER", "DEFAULT")
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
 
 
+async def get_app_settings(request: Request) -> Settings:
+    """create_app() で app.state に保持した設定を返す
+
+    同期関数の依存はスレッドプール経由で実行されるため、
+    ルーターからはイベントループ上で完結するこちらを使う。
+    """
+    return request.app.state.settings
+
+
 # ===========================================
 # Infrastructure Dependencies
 # ===========================================
+# 同期関数の依存はリクエストごとにスレッドプールで実行される。
+# boto3クライアントを生成しうるものは同期のまま残し、
+# オブジェクトを組み立てるだけのものは async def にしてイベントループ上で解決する。
 
 def get_event_store(settings: Annotated[Settings, Depends(get_settings)]) -> EventStore:
     """EventStoreのDI"""
@@ -100,7 +112,7 @@ def get_event_publisher(settings: Annotated[Settings, Depends(get_settings)]) ->
     )
 
 
-def get_session_repository(
+async def get_session_repository(
     event_store: Annotated[EventStore, Depends(get_event_store)]
 ) -> SessionRepository:
     """SessionRepositoryのDI"""
@@ -199,28 +211,28 @@ class MockAgentPort(AgentPort):
 # Command Handler Dependencies
 # ===========================================
 
-def get_start_session_handler(
+async def get_start_session_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
     publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
 ) -> StartSessionHandler:
     return StartSessionHandler(repository, publisher)
 
 
-def get_send_message_handler(
+async def get_send_message_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
     publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
 ) -> SendMessageHandler:
     return SendMessageHandler(repository, publisher)
 
 
-def get_end_session_handler(
+async def get_end_session_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
     publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
 ) -> EndSessionHandler:
     return EndSessionHandler(repository, publisher)
 
 
-def get_execute_agent_handler(
+async def get_execute_agent_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
     agent: Annotated[AgentPort, Depends(get_agent_port)],
     publisher: Annotated[EventPublisher, Depends(get_event_publisher)],
@@ -232,19 +244,19 @@ def get_execute_agent_handler(
 # Query Handler Dependencies
 # ===========================================
 
-def get_session_query_handler(
+async def get_session_query_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
 ) -> GetSessionHandler:
     return GetSessionHandler(repository)
 
 
-def get_session_messages_handler(
+async def get_session_messages_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
 ) -> GetSessionMessagesHandler:
     return GetSessionMessagesHandler(repository)
 
 
-def get_active_sessions_handler(
+async def get_active_sessions_handler(
     repository: Annotated[SessionRepository, Depends(get_session_repository)],
 ) -> GetActiveSessionsHandler:
     return GetActiveSessionsHandler(repository)
@@ -254,7 +266,7 @@ def get_active_sessions_handler(
 # Type Aliases for Depends
 # ===========================================
 
-SettingsDep = Annotated[Settings, Depends(get_settings)]
+SettingsDep = Annotated[Settings, Depends(get_app_settings)]
 StartSessionHandlerDep = Annotated[StartSessionHandler, Depends(get_start_session_handler)]
 SendMessageHandlerDep = Annotated[SendMessageHandler, Depends(get_send_message_handler)]
 EndSessionHandlerDep = Annotated[EndSessionHandler, Depends(get_end_session_handler)]
@@ -1,10 +1,12 @@
 """FastAPI Main Application"""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
+from api.dependencies import get_settings
+from api.middleware import FastCORSMiddleware
 from api.routers import agents, health, sessions
 from api.routers.services import (
     browser,
@@ -17,11 +19,36 @@ from api.routers.services import (
     policy,
     runtime,
 )
+from api.routers.services.base import warm_adapters
+
+# (router, prefix, tags)
+ROUTER_SPECS = [
+    # Core routers
+    (health.router, "", ["Health"]),
+    (sessions.router, "/sessions", ["Sessions"]),
+    (agents.router, "/agents", ["Agents"]),
+    # Service-specific routers
+    (runtime.router, "/services/runtime", ["Services", "Runtime"]),
+    (memory.router, "/services/memory", ["Services", "Memory"]),
+    (gateway.router, "/services/gateway", ["Services", "Gateway"]),
+    (identity.router, "/services/identity", ["Services", "Identity"]),
+    (
+        code_interpreter.router,
+        "/services/code-interpreter",
+        ["Services", "Code Interpreter"],
+    ),
+    (browser.router, "/services/browser", ["Services", "Browser"]),
+    (observability.router, "/services/observability", ["Services", "Observability"]),
+    (evaluations.router, "/services/evaluations", ["Services", "Evaluations"]),
+    (policy.router, "/services/policy", ["Services", "Policy"]),
+]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Starting up...")
+    # アダプターの初期化コストを最初のリクエストではなく起動時に払う
+    await asyncio.to_thread(warm_adapters)
     yield
     print("Shutting down...")
 
@@ -33,58 +60,21 @@ def create_app() -> FastAPI:
         version="0.1.0",
         lifespan=lifespan,
     )
+    app.state.settings = get_settings()
 
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=[
-            "http://localhost:3000",
-            "https://main.d1lhqhvpifndxn.amplifyapp.com",
-            "https://*.amplifyapp.com",
-        ],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        FastCORSMiddleware,
+        origins=frozenset(
+            [
+                b"http://localhost:3000",
+                b"https://main.d1lhqhvpifndxn.amplifyapp.com",
+                b"https://*.amplifyapp.com",
+            ]
+        ),
     )
 
-    # Core routers
-    app.include_router(health.router, tags=["Health"])
-    app.include_router(sessions.router, prefix="/sessions", tags=["Sessions"])
-    app.include_router(agents.router, prefix="/agents", tags=["Agents"])
-
-    # Service-specific routers
-    app.include_router(
-        runtime.router, prefix="/services/runtime", tags=["Services", "Runtime"]
-    )
-    app.include_router(
-        memory.router, prefix="/services/memory", tags=["Services", "Memory"]
-    )
-    app.include_router(
-        gateway.router, prefix="/services/gateway", tags=["Services", "Gateway"]
-    )
-    app.include_router(
-        identity.router, prefix="/services/identity", tags=["Services", "Identity"]
-    )
-    app.include_router(
-        code_interpreter.router,
-        prefix="/services/code-interpreter",
-        tags=["Services", "Code Interpreter"],
-    )
-    app.include_router(
-        browser.router, prefix="/services/browser", tags=["Services", "Browser"]
-    )
-    app.include_router(
-        observability.router,
-        prefix="/services/observability",
-        tags=["Services", "Observability"],
-    )
-    app.include_router(
-        evaluations.router,
-        prefix="/services/evaluations",
-        tags=["Services", "Evaluations"],
-    )
-    app.include_router(
-        policy.router, prefix="/services/policy", tags=["Services", "Policy"]
-    )
+    for router, prefix, tags in ROUTER_SPECS:
+        app.include_router(router, prefix=prefix, tags=tags)
 
     return app
 
@@ -94,6 +84,23 @@ app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
+
+    # uvloop + httptools を優先し、未対応環境（Windows等）では標準実装にフォールバック
+    try:
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "asyncio", "auto"
+
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop=loop,
+        http=http,
+    )
 
 
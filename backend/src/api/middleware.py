@@ -0,0 +1,72 @@
+"""ASGI Middleware
+
+StarletteのCORSMiddlewareはリクエストごとにHeaders/Responseオブジェクトを生成するため、
+許可オリジンが固定の本APIでは最小限のASGIミドルウェアで処理する。
+"""
+
+# プリフライト応答の固定ヘッダー（bytesで事前構築）
+_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+_RESPONSE_HEADERS = [
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+]
+
+
+class FastCORSMiddleware:
+    """許可オリジンのみにCORSヘッダーを付与するASGIミドルウェア
+
+    credentials付きリクエストに対応するため、許可されたOriginの値をそのまま
+    Access-Control-Allow-Originとして返す。Originのない、または許可されていない
+    リクエストはそのままアプリに渡す。
+    """
+
+    def __init__(self, app, origins: frozenset[bytes]):
+        self.app = app
+        self.origins = origins
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or origin not in self.origins:
+            await self.app(scope, receive, send)
+            return
+
+        # プリフライトはアプリに渡さず即応答する（allow_headers="*" 相当で要求ヘッダーを許可）
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin), *_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"access-control-allow-origin", origin),
+                    *_RESPONSE_HEADERS,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -0,0 +1,48 @@
+"""共通レスポンスヘルパー"""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+# プロセス稼働中に内容が変わらないGETレスポンスはブラウザ・CDNにキャッシュさせる
+STATIC_CACHE_CONTROL = "public, max-age=60"
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """構築済みモデルをそのままJSON化して返す（response_model による再検証を省略）"""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+class StaticJSON:
+    """起動時にシリアライズした固定JSONとそのETag
+
+    If-None-Match が一致するリクエストにはボディなしの304を返す。
+    """
+
+    __slots__ = ("body", "etag", "_headers")
+
+    def __init__(self, content: Any):
+        self.body = orjson.dumps(content)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+        self._headers = {"etag": self.etag, "cache-control": STATIC_CACHE_CONTROL}
+
+    def _matches(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        return any(
+            tag.strip().removeprefix("W/") == self.etag for tag in if_none_match.split(",")
+        )
+
+    def response(self, request: Request) -> Response:
+        """リクエストの条件に応じて304またはJSONを返す"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and self._matches(if_none_match):
+            return Response(status_code=304, headers=self._headers)
+        return Response(content=self.body, media_type="application/json", headers=self._headers)
@@ -2,10 +2,11 @@
 
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel, Field
 
-from api.dependencies import SettingsDep
+from api.dependencies import Settings, SettingsDep
+from api.responses import StaticJSON
 
 router = APIRouter()
 
@@ -26,9 +27,12 @@ class AgentComparisonResponse(BaseModel):
     langchain: dict[str, Any]
 
 
-@router.get("/info", response_model=AgentInfoResponse)
-async def get_agent_info(settings: SettingsDep):
-    """現在のエージェント情報を取得"""
+# 設定値ごとのシリアライズ済みレスポンス（組み合わせは数通りしかない）
+_AGENT_INFO_CACHE: dict[tuple[str, bool, str], StaticJSON] = {}
+_TOOLS_CACHE: dict[str, StaticJSON] = {}
+
+
+def _build_agent_info(settings: Settings) -> StaticJSON:
     capabilities = ["chat", "tools", "streaming"]
 
     if settings.agent_type == "langchain":
@@ -40,18 +44,32 @@ async def get_agent_info(settings: SettingsDep):
         capabilities.append("bedrock_native")
         provider = "strands-agents"
 
-    return AgentInfoResponse(
-        agent_type=settings.agent_type,
-        model_id=settings.bedrock_model_id,
-        provider=provider,
-        capabilities=capabilities,
+    return StaticJSON(
+        AgentInfoResponse(
+            agent_type=settings.agent_type,
+            model_id=settings.bedrock_model_id,
+            provider=provider,
+            capabilities=capabilities,
+        ).model_dump()
     )
 
 
-@router.get("/comparison", response_model=AgentComparisonResponse)
-async def get_agent_comparison():
-    """Strands vs LangChainの比較情報を取得"""
-    return AgentComparisonResponse(
+@router.get("/info", responses={200: {"model": AgentInfoResponse}})
+async def get_agent_info(request: Request, settings: SettingsDep):
+    """現在のエージェント情報を取得"""
+    key = (settings.agent_type, settings.langfuse_enabled, settings.bedrock_model_id)
+    info = _AGENT_INFO_CACHE.get(key)
+    if info is None:
+        info = _AGENT_INFO_CACHE[key] = _build_agent_info(settings)
+    return info.response(request)
+
+
+# ===========================================
+# 静的レスポンス（モジュール読み込み時に一度だけシリアライズ）
+# ===========================================
+
+_COMPARISON = StaticJSON(
+    AgentComparisonResponse(
         strands={
             "name": "Strands Agents (AWS Bedrock AgentCore)",
             "strengths": [
@@ -84,42 +102,55 @@ async def get_agent_comparison():
                 "workflow": True,
             },
         },
-    )
+    ).model_dump()
+)
+
+# ツール定義は不変（タプルで保持し、リクエストごとに複製しない）
+_TOOLS: tuple[dict[str, Any], ...] = (
+    {
+        "name": "get_current_weather",
+        "description": "指定された場所の現在の天気を取得",
+        "available": True,
+    },
+    {
+        "name": "search_documents",
+        "description": "ドキュメントを検索",
+        "available": True,
+    },
+    {
+        "name": "calculate",
+        "description": "数式を計算",
+        "available": True,
+    },
+    {
+        "name": "create_task",
+        "description": "タスクを作成",
+        "available": True,
+    },
+    {
+        "name": "fetch_url",
+        "description": "URLからコンテンツを取得",
+        "available": True,
+    },
+)
+
+
+@router.get("/comparison", responses={200: {"model": AgentComparisonResponse}})
+async def get_agent_comparison(request: Request):
+    """Strands vs LangChainの比較情報を取得"""
+    return _COMPARISON.response(request)
 
 
 @router.get("/tools")
-async def list_available_tools(settings: SettingsDep):
+async def list_available_tools(request: Request, settings: SettingsDep):
     """利用可能なツール一覧を取得"""
-    tools = [
-        {
-            "name": "get_current_weather",
-            "description": "指定された場所の現在の天気を取得",
-            "available": True,
-        },
-        {
-            "name": "search_documents",
-            "description": "ドキュメントを検索",
-            "available": True,
-        },
-        {
-            "name": "calculate",
-            "description": "数式を計算",
-            "available": True,
-        },
-        {
-            "name": "create_task",
-            "description": "タスクを作成",
-            "available": True,
-        },
-        {
-            "name": "fetch_url",
-            "description": "URLからコンテンツを取得",
-            "available": True,
-        },
-    ]
-
-    return {
-        "agent_type": settings.agent_type,
-        "tools": tools,
-        "total_count": len(tools),
-    }
+    tools = _TOOLS_CACHE.get(settings.agent_type)
+    if tools is None:
+        tools = _TOOLS_CACHE[settings.agent_type] = StaticJSON(
+            {
+                "agent_type": settings.agent_type,
+                "tools": _TOOLS,
+                "total_count": len(_TOOLS),
+            }
+        )
+    return tools.response(request)
@@ -1,6 +1,7 @@
 """Health Router"""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -11,14 +12,16 @@ class HealthResponse(BaseModel):
     version: str
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check():
-    return HealthResponse(status="healthy", version="0.1.0")
-
+# 固定レスポンスは起動時に一度だけシリアライズする
+_HEALTH_BYTES = orjson.dumps(HealthResponse(status="healthy", version="0.1.0").model_dump())
+_READY_BYTES = orjson.dumps(HealthResponse(status="ready", version="0.1.0").model_dump())
 
-@router.get("/ready", response_model=HealthResponse)
-async def readiness_check():
-    return HealthResponse(status="ready", version="0.1.0")
 
+@router.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check():
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
+@router.get("/ready", responses={200: {"model": HealthResponse}})
+async def readiness_check():
+    return Response(content=_READY_BYTES, media_type="application/json")
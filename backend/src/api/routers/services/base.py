@@ -8,23 +8,46 @@ AgentCore vs LangChain の各サービス機能を比較検証するための
 - LangChain: LangGraph StateGraph, Checkpointing, ToolNode
 """
 
+import asyncio
+import os
 import time
+from collections.abc import Callable, Sequence
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel
+import orjson
+from cachetools import LRUCache
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from pydantic import BaseModel, field_validator
 import ulid
 
+from api.responses import StaticJSON, model_response
+from api.schemas.session import REQUEST_MODEL_CONFIG
+
+
+# 対応しているエージェントタイプ
+_SUPPORTED_AGENTS = ("strands", "langchain")
+_AGENT_TYPES = frozenset(_SUPPORTED_AGENTS)
+
 
 class ServiceExecuteRequest(BaseModel):
     """サービス実行リクエスト"""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     instruction: str
     agent_type: str  # "strands" or "langchain"
     tools: list[dict[str, Any]] | None = None
     use_memory: bool = True  # メモリ機能を使用するか
     session_id: str | None = None  # セッションID（メモリ継続用）
 
+    @field_validator("agent_type")
+    @classmethod
+    def validate_agent_type(cls, value: str) -> str:
+        """未対応のエージェントタイプはリクエスト解析時に拒否する"""
+        if value not in _AGENT_TYPES:
+            raise ValueError(f"Unknown agent type: {value}")
+        return value
+
 
 class ServiceExecuteResponse(BaseModel):
     """サービス実行レスポンス"""
@@ -34,7 +57,38 @@ class ServiceExecuteResponse(BaseModel):
     tool_calls: list[dict[str, Any]] | None = None
     latency_ms: int
     metadata: dict[str, Any] | None = None
-    framework_features: list[str] | None = None
+    framework_features: Sequence[str] | None = None
+
+
+# サービス側で機能一覧が指定されていない場合の既定値
+_DEFAULT_STRANDS_FEATURES = (
+    "bedrock_native_integration",
+    "conversation_memory",
+    "episodic_memory",
+    "tool_decorator",
+)
+_DEFAULT_LANGCHAIN_FEATURES = (
+    "langgraph_state_management",
+    "checkpointing",
+    "tool_node_automation",
+    "multi_provider_support",
+)
+
+
+def _dict_response(content: dict[str, Any]) -> Response:
+    """プリミティブのみの dict を orjson で直接JSON化して返す（jsonable_encoder を経由しない）"""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+
+# 比較実行のエラーレスポンス雛形（値が確定しているためバリデーションを省略して生成する）
+_ERROR_RESPONSE_TEMPLATE: dict[str, Any] = {
+    "response_id": None,
+    "content": None,
+    "tool_calls": None,
+    "latency_ms": 0,
+    "metadata": None,
+    "framework_features": None,
+}
 
 
 class ServiceComparisonResult(BaseModel):
@@ -45,19 +99,76 @@ class ServiceComparisonResult(BaseModel):
     comparison: dict[str, Any] | None = None
 
 
+# セッションごとに保持するアダプター数の上限
+ADAPTER_CACHE_SIZE = int(os.getenv("ADAPTER_CACHE_SIZE", "512"))
+
+
+class AdapterCache(LRUCache):
+    """アダプターのLRUキャッシュ
+
+    上限を超えて追い出されたアダプターは clear_memory() でメモリを解放する。
+    """
+
+    def popitem(self):
+        key, adapter = super().popitem()
+        try:
+            adapter.clear_memory()
+        except Exception as e:
+            print(f"Warning: failed to clear evicted adapter {key}: {e}")
+        return key, adapter
+
+
 # アダプターインスタンスのキャッシュ（セッション管理用）
-_strands_adapters: dict[str, Any] = {}
-_langchain_adapters: dict[str, Any] = {}
+_strands_adapters: AdapterCache = AdapterCache(maxsize=ADAPTER_CACHE_SIZE)
+_langchain_adapters: AdapterCache = AdapterCache(maxsize=ADAPTER_CACHE_SIZE)
+
+# アダプター生成関数（初回呼び出し時にimportし、以降はモジュール変数を再利用）
+_create_strands = None
+_create_langchain = None
+
+# lifespan で事前生成したアダプター（会話メモリを共有しないよう最初の1リクエストにだけ引き渡す）
+_warm_strands = None
+_warm_langchain = None
+
+
+def warm_adapters() -> None:
+    """アダプター生成関数をimportし、1つずつ事前生成しておく
+
+    初回リクエストで発生するimport・Bedrockクライアント初期化のコストを起動時に移す。
+    PoCパッケージが未インストールの場合などはスキップする。
+    """
+    global _create_strands, _create_langchain, _warm_strands, _warm_langchain
+
+    try:
+        from strands_poc.adapter import create_strands_adapter as _create_strands
+
+        _warm_strands = _create_strands()
+    except Exception as e:
+        print(f"Warning: Strands adapter warm-up skipped: {e}")
+
+    try:
+        from langchain_poc.adapter import create_langchain_adapter as _create_langchain
+
+        _warm_langchain = _create_langchain()
+    except Exception as e:
+        print(f"Warning: LangChain adapter warm-up skipped: {e}")
 
 
 def get_strands_adapter(session_id: str | None = None):
     """Strands Agentアダプターを取得（セッション対応）"""
-    from strands_poc.adapter import create_strands_adapter
+    global _create_strands, _warm_strands
 
-    if session_id and session_id in _strands_adapters:
-        return _strands_adapters[session_id]
+    adapter = _strands_adapters.get(session_id) if session_id else None
+    if adapter is not None:
+        return adapter
+
+    if _warm_strands is not None:
+        adapter, _warm_strands = _warm_strands, None
+    else:
+        if _create_strands is None:
+            from strands_poc.adapter import create_strands_adapter as _create_strands
+        adapter = _create_strands()
 
-    adapter = create_strands_adapter()
     if session_id:
         _strands_adapters[session_id] = adapter
     return adapter
@@ -65,17 +176,31 @@ def get_strands_adapter(session_id: str | None = None):
 
 def get_langchain_adapter(session_id: str | None = None):
     """LangChainアダプターを取得（セッション対応）"""
-    from langchain_poc.adapter import create_langchain_adapter
+    global _create_langchain, _warm_langchain
+
+    adapter = _langchain_adapters.get(session_id) if session_id else None
+    if adapter is not None:
+        return adapter
 
-    if session_id and session_id in _langchain_adapters:
-        return _langchain_adapters[session_id]
+    if _warm_langchain is not None:
+        adapter, _warm_langchain = _warm_langchain, None
+    else:
+        if _create_langchain is None:
+            from langchain_poc.adapter import create_langchain_adapter as _create_langchain
+        adapter = _create_langchain()
 
-    adapter = create_langchain_adapter()
     if session_id:
         _langchain_adapters[session_id] = adapter
     return adapter
 
 
+# agent_type ごとのアダプター取得関数（agent_type はリクエスト解析時に検証済み）
+_ADAPTER_GETTERS: dict[str, Callable[[str | None], Any]] = {
+    "strands": get_strands_adapter,
+    "langchain": get_langchain_adapter,
+}
+
+
 def create_service_router(
     service_name: str,
     service_description: str,
@@ -88,37 +213,26 @@ def create_service_router(
     """
     router = APIRouter()
 
-    @router.post("/execute", response_model=ServiceExecuteResponse)
-    async def execute(request: ServiceExecuteRequest) -> ServiceExecuteResponse:
+    # execute で返す機能一覧（未指定時はフレームワーク既定値）
+    resolved_features = {
+        "strands": tuple(strands_features) if strands_features else _DEFAULT_STRANDS_FEATURES,
+        "langchain": (
+            tuple(langchain_features) if langchain_features else _DEFAULT_LANGCHAIN_FEATURES
+        ),
+    }
+
+    @router.post("/execute", responses={200: {"model": ServiceExecuteResponse}})
+    async def execute(request: ServiceExecuteRequest) -> Response:
         """サービスを実行
 
         指定されたフレームワーク（Strands/LangChain）で実行し、
         フレームワーク固有の機能を活用した結果を返す。
         """
-        start_time = time.time()
+        start = time.perf_counter_ns()
 
         try:
-            if request.agent_type == "strands":
-                adapter = get_strands_adapter(request.session_id)
-                framework_features = strands_features or [
-                    "bedrock_native_integration",
-                    "conversation_memory",
-                    "episodic_memory",
-                    "tool_decorator",
-                ]
-            elif request.agent_type == "langchain":
-                adapter = get_langchain_adapter(request.session_id)
-                framework_features = langchain_features or [
-                    "langgraph_state_management",
-                    "checkpointing",
-                    "tool_node_automation",
-                    "multi_provider_support",
-                ]
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Unknown agent type: {request.agent_type}",
-                )
+            adapter = _ADAPTER_GETTERS[request.agent_type](request.session_id)
+            framework_features = resolved_features[request.agent_type]
 
             # ツール付きか通常実行か判定
             if request.tools:
@@ -133,10 +247,10 @@ def create_service_router(
                     instruction=request.instruction,
                 )
 
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
-            return ServiceExecuteResponse(
-                response_id=str(ulid.new()),
+            return model_response(ServiceExecuteResponse(
+                response_id=ulid.new().str,
                 content=response.content,
                 tool_calls=response.tool_calls,
                 latency_ms=latency_ms,
@@ -148,7 +262,7 @@ def create_service_router(
                     **(response.metadata or {}),
                 },
                 framework_features=framework_features,
-            )
+            ))
 
         except ImportError as e:
             raise HTTPException(
@@ -161,26 +275,18 @@ def create_service_router(
                 detail=f"Execution failed: {e}",
             ) from e
 
-    @router.post("/execute-with-tools", response_model=ServiceExecuteResponse)
-    async def execute_with_tools(request: ServiceExecuteRequest) -> ServiceExecuteResponse:
+    @router.post("/execute-with-tools", responses={200: {"model": ServiceExecuteResponse}})
+    async def execute_with_tools(request: ServiceExecuteRequest) -> Response:
         """ツール付きでサービスを実行
 
         各フレームワークのツール呼び出し機能を活用:
         - Strands: @tool decorator + automatic tool loop
         - LangChain: LangGraph ToolNode + conditional edges
         """
-        start_time = time.time()
+        start = time.perf_counter_ns()
 
         try:
-            if request.agent_type == "strands":
-                adapter = get_strands_adapter(request.session_id)
-            elif request.agent_type == "langchain":
-                adapter = get_langchain_adapter(request.session_id)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Unknown agent type: {request.agent_type}",
-                )
+            adapter = _ADAPTER_GETTERS[request.agent_type](request.session_id)
 
             response = await adapter.execute_with_tools(
                 context=[],
@@ -188,10 +294,10 @@ def create_service_router(
                 tools=request.tools,
             )
 
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
-            return ServiceExecuteResponse(
-                response_id=str(ulid.new()),
+            return model_response(ServiceExecuteResponse(
+                response_id=ulid.new().str,
                 content=response.content,
                 tool_calls=response.tool_calls,
                 latency_ms=latency_ms,
@@ -201,7 +307,7 @@ def create_service_router(
                     "execution_type": "with_tools",
                     **(response.metadata or {}),
                 },
-            )
+            ))
 
         except Exception as e:
             raise HTTPException(
@@ -209,77 +315,51 @@ def create_service_router(
                 detail=f"Execution failed: {e}",
             ) from e
 
-    @router.post("/compare", response_model=ServiceComparisonResult)
-    async def compare_frameworks(request: ServiceExecuteRequest) -> ServiceComparisonResult:
+    @router.post("/compare", responses={200: {"model": ServiceComparisonResult}})
+    async def compare_frameworks(request: ServiceExecuteRequest) -> Response:
         """両フレームワークで実行して比較
 
         同じ指示を Strands Agents と LangChain で実行し、
         結果を比較可能な形式で返す。
         """
-        strands_result = None
-        langchain_result = None
-
-        # Strands Agents で実行
-        try:
-            strands_adapter = get_strands_adapter()
-            start_time = time.time()
-
-            if request.tools:
-                strands_response = await strands_adapter.execute_with_tools(
-                    context=[], instruction=request.instruction, tools=request.tools
-                )
-            else:
-                strands_response = await strands_adapter.execute(
-                    context=[], instruction=request.instruction
-                )
-
-            strands_latency = int((time.time() - start_time) * 1000)
-            strands_result = ServiceExecuteResponse(
-                response_id=str(ulid.new()),
-                content=strands_response.content,
-                tool_calls=strands_response.tool_calls,
-                latency_ms=strands_latency,
-                metadata=strands_response.metadata,
-                framework_features=strands_features,
-            )
-        except Exception as e:
-            strands_result = ServiceExecuteResponse(
-                response_id=str(ulid.new()),
-                content=f"Error: {e}",
-                latency_ms=0,
-                metadata={"error": str(e)},
-            )
-
-        # LangChain で実行
-        try:
-            langchain_adapter = get_langchain_adapter()
-            start_time = time.time()
 
-            if request.tools:
-                langchain_response = await langchain_adapter.execute_with_tools(
-                    context=[], instruction=request.instruction, tools=request.tools
+        async def run_framework(get_adapter, features) -> ServiceExecuteResponse:
+            """1フレームワーク分を実行（失敗はエラーレスポンスに変換）"""
+            try:
+                adapter = get_adapter()
+                start = time.perf_counter_ns()
+
+                if request.tools:
+                    response = await adapter.execute_with_tools(
+                        context=[], instruction=request.instruction, tools=request.tools
+                    )
+                else:
+                    response = await adapter.execute(
+                        context=[], instruction=request.instruction
+                    )
+
+                latency_ms = (time.perf_counter_ns() - start) // 1_000_000
+                return ServiceExecuteResponse(
+                    response_id=ulid.new().str,
+                    content=response.content,
+                    tool_calls=response.tool_calls,
+                    latency_ms=latency_ms,
+                    metadata=response.metadata,
+                    framework_features=features,
                 )
-            else:
-                langchain_response = await langchain_adapter.execute(
-                    context=[], instruction=request.instruction
-                )
-
-            langchain_latency = int((time.time() - start_time) * 1000)
-            langchain_result = ServiceExecuteResponse(
-                response_id=str(ulid.new()),
-                content=langchain_response.content,
-                tool_calls=langchain_response.tool_calls,
-                latency_ms=langchain_latency,
-                metadata=langchain_response.metadata,
-                framework_features=langchain_features,
-            )
-        except Exception as e:
-            langchain_result = ServiceExecuteResponse(
-                response_id=str(ulid.new()),
-                content=f"Error: {e}",
-                latency_ms=0,
-                metadata={"error": str(e)},
-            )
+            except Exception as e:
+                error = str(e)
+                fields = _ERROR_RESPONSE_TEMPLATE.copy()
+                fields["response_id"] = ulid.new().str
+                fields["content"] = f"Error: {error}"
+                fields["metadata"] = {"error": error}
+                return ServiceExecuteResponse.model_construct(**fields)
+
+        # Strands Agents と LangChain を並行実行（latency_ms は各フレームワーク単体の値）
+        strands_result, langchain_result = await asyncio.gather(
+            run_framework(get_strands_adapter, strands_features),
+            run_framework(get_langchain_adapter, langchain_features),
+        )
 
         # 比較分析
         comparison = {
@@ -300,72 +380,78 @@ def create_service_router(
             "service": service_name,
         }
 
-        return ServiceComparisonResult(
+        return model_response(ServiceComparisonResult(
             strands_result=strands_result,
             langchain_result=langchain_result,
             comparison=comparison,
-        )
+        ))
 
-    @router.get("/info")
-    async def get_info():
-        """サービス情報を取得"""
-        return {
+    # サービス情報はルーター作成時に一度だけシリアライズする
+    info = StaticJSON(
+        {
             "service": service_name,
             "description": service_description,
-            "supported_agents": ["strands", "langchain"],
+            "supported_agents": _SUPPORTED_AGENTS,
             "strands_features": strands_features or [],
             "langchain_features": langchain_features or [],
             "comparison_available": True,
         }
+    )
 
-    @router.get("/memory-stats/{session_id}")
+    @router.get("/info", response_model=None)
+    async def get_info(request: Request):
+        """サービス情報を取得"""
+        return info.response(request)
+
+    @router.get("/memory-stats/{session_id}", response_model=None)
     async def get_memory_stats(session_id: str, agent_type: str = "strands"):
         """セッションのメモリ統計を取得"""
         try:
-            if agent_type == "strands" and session_id in _strands_adapters:
-                adapter = _strands_adapters[session_id]
-                return {
-                    "session_id": session_id,
-                    "agent_type": "strands",
-                    "stats": adapter.get_memory_stats(),
-                }
-            elif agent_type == "langchain" and session_id in _langchain_adapters:
-                adapter = _langchain_adapters[session_id]
-                return {
-                    "session_id": session_id,
-                    "agent_type": "langchain",
-                    "stats": adapter.get_memory_stats(),
-                    "execution_stats": adapter.get_execution_stats(),
-                }
-            else:
-                return {
-                    "session_id": session_id,
-                    "agent_type": agent_type,
-                    "error": "Session not found",
-                }
+            if agent_type == "strands":
+                adapter = _strands_adapters.get(session_id)
+                if adapter is not None:
+                    return _dict_response({
+                        "session_id": session_id,
+                        "agent_type": "strands",
+                        "stats": adapter.get_memory_stats(),
+                    })
+            elif agent_type == "langchain":
+                adapter = _langchain_adapters.get(session_id)
+                if adapter is not None:
+                    return _dict_response({
+                        "session_id": session_id,
+                        "agent_type": "langchain",
+                        "stats": adapter.get_memory_stats(),
+                        "execution_stats": adapter.get_execution_stats(),
+                    })
+            return _dict_response({
+                "session_id": session_id,
+                "agent_type": agent_type,
+                "error": "Session not found",
+            })
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=str(e),
             ) from e
 
-    @router.delete("/session/{session_id}")
+    @router.delete("/session/{session_id}", response_model=None)
     async def clear_session(session_id: str):
         """セッションをクリア"""
         cleared = []
-        if session_id in _strands_adapters:
-            _strands_adapters[session_id].clear_memory()
-            del _strands_adapters[session_id]
+        adapter = _strands_adapters.pop(session_id, None)
+        if adapter is not None:
+            adapter.clear_memory()
             cleared.append("strands")
-        if session_id in _langchain_adapters:
-            _langchain_adapters[session_id].clear_memory()
-            del _langchain_adapters[session_id]
+        adapter = _langchain_adapters.pop(session_id, None)
+        if adapter is not None:
+            adapter.clear_memory()
             cleared.append("langchain")
 
-        return {
+        return _dict_response({
             "session_id": session_id,
             "cleared": cleared,
             "success": len(cleared) > 0,
-        }
+        })
 
     return router
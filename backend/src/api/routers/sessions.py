@@ -1,5 +1,7 @@
 """Sessions Router - CQRS統合済み"""
 
+import time
+
 from fastapi import APIRouter, HTTPException, status
 
 from api.dependencies import (
@@ -11,6 +13,7 @@ from api.dependencies import (
     SendMessageHandlerDep,
     StartSessionHandlerDep,
 )
+from api.responses import model_response
 from api.schemas.session import (
     CreateSessionRequest,
     CreateSessionResponse,
@@ -36,7 +39,11 @@ from application.queries import (
 router = APIRouter()
 
 
-@router.post("", response_model=CreateSessionResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": CreateSessionResponse}},
+)
 async def create_session(
     request: CreateSessionRequest,
     handler: StartSessionHandlerDep,
@@ -48,14 +55,17 @@ async def create_session(
     )
     session_id = await handler.handle(command)
 
-    return CreateSessionResponse(
-        session_id=session_id,
-        agent_id=command.agent_id,
-        created_at="",  # handlerから取得するように改善可能
+    return model_response(
+        CreateSessionResponse(
+            session_id=session_id,
+            agent_id=command.agent_id,
+            created_at="",  # handlerから取得するように改善可能
+        ),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
-@router.get("", response_model=SessionListResponse)
+@router.get("", responses={200: {"model": SessionListResponse}})
 async def list_active_sessions(
     user_id: str,
     handler: GetActiveSessionsHandlerDep,
@@ -64,22 +74,25 @@ async def list_active_sessions(
     query = GetActiveSessionsQuery(user_id=user_id)
     sessions = await handler.handle(query)
 
-    return SessionListResponse(
-        sessions=[
-            SessionResponse(
-                session_id=s.id,
-                agent_id=s.agent_id,
-                state=s.state,
-                created_at=s.created_at,
-                message_count=s.message_count,
-            )
-            for s in sessions
-        ],
-        total_count=len(sessions),
+    # DTOはクエリハンドラで型が確定しているため、検証を省略して組み立てる
+    return model_response(
+        SessionListResponse.model_construct(
+            sessions=[
+                SessionResponse.model_construct(
+                    session_id=s.id,
+                    agent_id=s.agent_id,
+                    state=s.state,
+                    created_at=s.created_at,
+                    message_count=s.message_count,
+                )
+                for s in sessions
+            ],
+            total_count=len(sessions),
+        )
     )
 
 
-@router.get("/{session_id}", response_model=SessionResponse)
+@router.get("/{session_id}", responses={200: {"model": SessionResponse}})
 async def get_session(
     session_id: str,
     handler: GetSessionHandlerDep,
@@ -94,16 +107,18 @@ async def get_session(
             detail=f"Session {session_id} not found",
         )
 
-    return SessionResponse(
-        session_id=session.id,
-        agent_id=session.agent_id,
-        state=session.state,
-        created_at=session.created_at,
-        message_count=session.message_count,
+    return model_response(
+        SessionResponse.model_construct(
+            session_id=session.id,
+            agent_id=session.agent_id,
+            state=session.state,
+            created_at=session.created_at,
+            message_count=session.message_count,
+        )
     )
 
 
-@router.get("/{session_id}/messages", response_model=MessageListResponse)
+@router.get("/{session_id}/messages", responses={200: {"model": MessageListResponse}})
 async def get_session_messages(
     session_id: str,
     handler: GetSessionMessagesHandlerDep,
@@ -118,21 +133,23 @@ async def get_session_messages(
     )
     messages = await handler.handle(query)
 
-    return MessageListResponse(
-        messages=[
-            {
-                "id": m.id,
-                "role": m.role,
-                "content": m.content,
-                "created_at": m.created_at,
-            }
-            for m in messages
-        ],
-        total_count=len(messages),
+    return model_response(
+        MessageListResponse.model_construct(
+            messages=[
+                {
+                    "id": m.id,
+                    "role": m.role,
+                    "content": m.content,
+                    "created_at": m.created_at,
+                }
+                for m in messages
+            ],
+            total_count=len(messages),
+        )
     )
 
 
-@router.post("/{session_id}/messages", response_model=SendInstructionResponse)
+@router.post("/{session_id}/messages", responses={200: {"model": SendInstructionResponse}})
 async def send_message(
     session_id: str,
     request: SendInstructionRequest,
@@ -140,8 +157,7 @@ async def send_message(
     execute_handler: ExecuteAgentHandlerDep,
 ):
     """メッセージを送信してエージェントレスポンスを取得"""
-    import time
-    start_time = time.time()
+    start = time.perf_counter_ns()
 
     try:
         # ユーザーメッセージを追加
@@ -159,14 +175,16 @@ async def send_message(
         )
         result = await execute_handler.handle(execute_command)
 
-        latency_ms = int((time.time() - start_time) * 1000)
+        latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
-        return SendInstructionResponse(
-            response_id=result["message_id"],
-            content=result["content"],
-            tool_calls=result.get("tool_calls"),
-            latency_ms=latency_ms,
-            metadata=result.get("metadata"),
+        return model_response(
+            SendInstructionResponse(
+                response_id=result["message_id"],
+                content=result["content"],
+                tool_calls=result.get("tool_calls"),
+                latency_ms=latency_ms,
+                metadata=result.get("metadata"),
+            )
         )
 
     except SessionNotFoundError as e:
@@ -2,12 +2,17 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# リクエストモデル共通設定（未知フィールドは無視、解析後は不変）
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class CreateSessionRequest(BaseModel):
     """セッション作成リクエスト"""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     agent_id: str | None = Field(None, description="エージェントID")
     user_id: str | None = Field(None, description="ユーザーID")
     metadata: dict[str, Any] | None = Field(None, description="メタデータ")
@@ -24,6 +29,8 @@ class CreateSessionResponse(BaseModel):
 class SendInstructionRequest(BaseModel):
     """命令送信リクエスト"""
 
+    model_config = REQUEST_MODEL_CONFIG
+
     instruction: str = Field(..., description="エージェントへの命令")
     tools: list[dict[str, Any]] | None = Field(None, description="使用するツール")
     metadata: dict[str, Any] | None = Field(None, description="メタデータ")
@@ -176,7 +176,7 @@ class AgentCoreRuntimeAdapter(AgentPort):
         instruction: str,
     ) -> AgentResponse:
         """AgentCore Runtimeを経由してエージェントを実行"""
-        start_time = time.time()
+        start = time.perf_counter_ns()
         session_id = self._generate_session_id()
 
         logger.info(
@@ -197,7 +197,7 @@ class AgentCoreRuntimeAdapter(AgentPort):
             )
 
             result = self._parse_response(response)
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
             result.metadata["latency_ms"] = latency_ms
 
             logger.info(f"AgentCore Runtime response received in {latency_ms}ms")
@@ -236,7 +236,7 @@ class AgentCoreRuntimeAdapter(AgentPort):
         tools: list[dict[str, Any]] | None = None,
     ) -> AgentResponse:
         """ツール付きでAgentCore Runtimeを経由してエージェントを実行"""
-        start_time = time.time()
+        start = time.perf_counter_ns()
         session_id = self._generate_session_id()
 
         logger.info(
@@ -257,7 +257,7 @@ class AgentCoreRuntimeAdapter(AgentPort):
             )
 
             result = self._parse_response(response)
-            latency_ms = int((time.time() - start_time) * 1000)
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
             result.metadata["latency_ms"] = latency_ms
             result.metadata["tools_provided"] = len(tools) if tools else 0
 
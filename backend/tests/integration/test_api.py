@@ -40,3 +40,57 @@ class TestSessionsAPI:
         response = await client.post("/sessions", json=sample_session_data)
         assert response.status_code == 201
         assert "session_id" in response.json()
+
+
+class TestCORS:
+    @pytest.mark.asyncio
+    async def test_preflight_allowed_origin(self, client):
+        response = await client.options(
+            "/health",
+            headers={
+                "origin": "http://localhost:3000",
+                "access-control-request-method": "GET",
+                "access-control-request-headers": "content-type",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["access-control-allow-headers"] == "content-type"
+
+    @pytest.mark.asyncio
+    async def test_simple_request_allowed_origin(self, client):
+        response = await client.get("/health", headers={"origin": "http://localhost:3000"})
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+    @pytest.mark.asyncio
+    async def test_disallowed_origin(self, client):
+        response = await client.get("/health", headers={"origin": "http://evil.example"})
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestServicesAPI:
+    @pytest.mark.asyncio
+    async def test_service_info(self, client):
+        response = await client.get("/services/memory/info")
+        assert response.status_code == 200
+        assert response.json()["supported_agents"] == ["strands", "langchain"]
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_unknown_agent_type(self, client):
+        response = await client.post(
+            "/services/memory/execute",
+            json={"instruction": "hello", "agent_type": "unknown"},
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_service_info_not_modified(self, client):
+        response = await client.get("/services/memory/info")
+        etag = response.headers["etag"]
+
+        response = await client.get("/services/memory/info", headers={"if-none-match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
@@ -0,0 +1,20 @@
+"""Route Definition Tests"""
+
+import inspect
+
+from fastapi.routing import APIRoute
+
+from api.main import create_app
+
+
+class TestRoutes:
+    def test_all_endpoints_are_async(self):
+        """同期エンドポイントはスレッドプール経由で実行されるため、全て async def であること"""
+        app = create_app()
+        sync_endpoints = [
+            route.path
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            and not inspect.iscoroutinefunction(route.endpoint)
+        ]
+        assert sync_endpoints == []
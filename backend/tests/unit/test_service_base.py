@@ -0,0 +1,49 @@
+"""Service Router Base Tests"""
+
+from api.routers.services.base import AdapterCache
+
+
+class _FakeAdapter:
+    def __init__(self):
+        self.cleared = False
+
+    def clear_memory(self):
+        self.cleared = True
+
+
+class TestAdapterCache:
+    def test_evicts_least_recently_used(self):
+        cache = AdapterCache(maxsize=2)
+        first, second, third = _FakeAdapter(), _FakeAdapter(), _FakeAdapter()
+        cache["a"] = first
+        cache["b"] = second
+        assert cache["a"] is first  # "a" を最近使用にする
+
+        cache["c"] = third
+
+        assert "b" not in cache
+        assert second.cleared is True
+        assert first.cleared is False
+        assert "a" in cache and "c" in cache
+
+    def test_delete_does_not_clear_memory(self):
+        cache = AdapterCache(maxsize=2)
+        adapter = _FakeAdapter()
+        cache["a"] = adapter
+
+        del cache["a"]
+
+        assert "a" not in cache
+        assert adapter.cleared is False
+
+    def test_eviction_survives_clear_memory_failure(self, capsys):
+        class _FailingAdapter:
+            def clear_memory(self):
+                raise RuntimeError("boom")
+
+        cache = AdapterCache(maxsize=1)
+        cache["a"] = _FailingAdapter()
+        cache["b"] = _FakeAdapter()
+
+        assert "a" not in cache and "b" in cache
+        assert "failed to clear evicted adapter a: boom" in capsys.readouterr().out